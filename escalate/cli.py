@@ -5,15 +5,37 @@ import argparse
 import logging
 import json
 import datetime
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, Any, Optional, Tuple, List
 
 from escalate.config import Config
-from escalate.escalator import Escalator
-from escalate.models import EscalationHistory
 from escalate.logger import configure_logging
 
 logger = logging.getLogger(__name__)
 
+# Sort key for (key, value) pairs and (level, timestamp) tuples
+_KEY0 = itemgetter(0)
+
+# Maximum number of JIRA searches run concurrently during a dry run
+DRY_RUN_MAX_WORKERS = 8
+
+# (seconds per unit, label) pairs used to render "X <unit> ago", largest first
+_TIME_UNITS = ((86400, "days"), (3600, "hours"), (60, "minutes"), (1, "seconds"))
+
+def _format_time_ago(seconds: float, units: Tuple[Tuple[int, str], ...] = _TIME_UNITS) -> str:
+    """Render an elapsed number of seconds using the largest fitting unit."""
+    for unit_seconds, label in units:
+        if seconds >= unit_seconds:
+            return f"{int(seconds / unit_seconds)} {label} ago"
+    return f"{int(seconds)} seconds ago"
+
+def _write_lines(lines: List[str]) -> None:
+    """Write report lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Escalate JIRA issues based on rules")
@@ -70,99 +92,85 @@ def parse_args() -> argparse.Namespace:
 
 def list_rules(config: Config) -> None:
     """Print all rules in the config file."""
-    rules_by_level = config.get_rules_by_level()
+    rules_by_level = config.rules_by_level
     levels = sorted(rules_by_level.keys())
     
-    print(f"Found {len(config.rules)} rules across {len(levels)} levels:")
+    out = [f"Found {len(config.rules)} rules across {len(levels)} levels:"]
     
     for level in levels:
         rules = rules_by_level[level]
-        print(f"\n=== LEVEL {level} Rules ({len(rules)}) ===")
+        out.append(f"\n=== LEVEL {level} Rules ({len(rules)}) ===")
         
         for i, rule in enumerate(rules, 1):
-            name = rule.get("name", f"Rule {i}")
-            jql = rule.get("jql", "No JQL specified")
-            max_time = rule.get("max_time_in_status_minutes", "Not specified")
-            days_to_activate = rule.get("days_to_activate", 0)
-            
-            print(f"\n{level}.{i}. {name}")
-            print(f"   JQL: {jql}")
-            print(f"   Max time in status: {max_time} minutes")
-            if days_to_activate > 0:
-                print(f"   Days to activate: {days_to_activate}")
+            out.append(f"\n{level}.{i}. {rule.name or f'Rule {i}'}")
+            out.append(f"   JQL: {rule.jql}")
+            out.append(f"   Max time in status: {rule.max_time_in_status_minutes} minutes")
+            if rule.days_to_activate > 0:
+                out.append(f"   Days to activate: {rule.days_to_activate}")
             
-            paths = rule.get("escalation_paths", [])
-            print(f"   Escalation paths ({len(paths)}):")
+            paths = rule.escalation_paths
+            out.append(f"   Escalation paths ({len(paths)}):")
             
             for j, path in enumerate(paths, 1):
-                path_type = path.get("type", "Unknown")
-                recipient = path.get("recipient", "Not specified")
-                print(f"     {j}. {path_type} -> {recipient}")
+                out.append(f"     {j}. {path.type.value} -> {path.recipient or 'Not specified'}")
+    
+    _write_lines(out)
 
 def show_history(config: Config) -> None:
     """Show escalation history."""
-    history_path = config.get_history_file_path()
+    from escalate.models import EscalationHistory
+    
+    history_path = config.history_file_path
     history = EscalationHistory(history_path)
+    last_escalations = history.last_escalations
     
-    if not history.last_escalations:
+    if not last_escalations:
         print("No escalation history found.")
         return
     
     # Group by issue key
-    issues = {}
-    for (issue_key, level), timestamp in history.last_escalations.items():
-        if issue_key not in issues:
-            issues[issue_key] = []
+    issues = defaultdict(list)
+    for (issue_key, level), timestamp in last_escalations.items():
         issues[issue_key].append((level, timestamp))
     
-    print(f"Escalation history for {len(issues)} issues:")
+    out = [f"Escalation history for {len(issues)} issues:"]
+    
+    # History timestamps are epoch seconds
+    now = time.time()
+    first_seen_for = history.get_all_first_seen().get
     
-    for issue_key, escalations in sorted(issues.items()):
+    for issue_key, escalations in sorted(issues.items(), key=_KEY0):
         # Sort by level
-        escalations.sort(key=lambda x: x[0])
+        escalations.sort(key=_KEY0)
         
-        first_seen = history.get_issue_first_seen(issue_key)
-        days_since = (datetime.datetime.now() - first_seen).days if first_seen else 0
+        first_seen = first_seen_for(issue_key)
+        days_since = int((now - first_seen) // 86400) if first_seen else 0
         
-        print(f"\n{issue_key} (first seen {days_since} days ago):")
+        out.append(f"\n{issue_key} (first seen {days_since} days ago):")
         
         for level, timestamp in escalations:
-            time_ago = datetime.datetime.now() - timestamp
-            if time_ago.total_seconds() < 60:
-                time_str = f"{int(time_ago.total_seconds())} seconds ago"
-            elif time_ago.total_seconds() < 3600:
-                time_str = f"{int(time_ago.total_seconds() / 60)} minutes ago"
-            elif time_ago.total_seconds() < 86400:
-                time_str = f"{int(time_ago.total_seconds() / 3600)} hours ago"
-            else:
-                time_str = f"{int(time_ago.total_seconds() / 86400)} days ago"
+            time_str = _format_time_ago(now - timestamp)
+            escalated_at = datetime.datetime.fromtimestamp(timestamp)
             
-            print(f"  Level {level}: {timestamp.strftime('%Y-%m-%d %H:%M:%S')} ({time_str})")
+            out.append(f"  Level {level}: {escalated_at.strftime('%Y-%m-%d %H:%M:%S')} ({time_str})")
+    
+    _write_lines(out)
 
 def clear_history(config: Config, issue_key: Optional[str] = None) -> None:
     """Clear escalation history."""
-    history_path = config.get_history_file_path()
+    history_path = config.history_file_path
     
     if not os.path.exists(history_path):
         print("No escalation history found.")
         return
     
     if issue_key:
+        from escalate.models import EscalationHistory
+        
         # Only clear history for a specific issue
         history = EscalationHistory(history_path)
-        to_remove = []
-        
-        # Find all entries for this issue
-        for (key, level), _ in history.last_escalations.items():
-            if key == issue_key:
-                to_remove.append((key, level))
-        
-        # Remove entries
-        for key in to_remove:
-            del history.last_escalations[key]
-        
-        # Save
-        history.save_history()
+        history.delete_issue(issue_key)
+        history.close()
         print(f"Cleared escalation history for issue {issue_key}.")
     else:
         # Remove the entire history file
@@ -171,123 +179,144 @@ def clear_history(config: Config, issue_key: Optional[str] = None) -> None:
 
 def list_active_escalations(config: Config) -> None:
     """List currently active escalations across all levels."""
-    history_path = config.get_history_file_path()
+    from escalate.models import EscalationHistory
+    
+    history_path = config.history_file_path
     history = EscalationHistory(history_path)
+    last_escalations = history.last_escalations
     
-    if not history.last_escalations:
+    if not last_escalations:
         print("No escalation history found.")
         return
     
-    now = datetime.datetime.now()
+    # History timestamps are epoch seconds
+    now = time.time()
     cooldown_hours = config.escalation_cooldown_hours
+    cooldown = cooldown_hours * 3600
+    cutoff = now - cooldown
     
-    # Find active escalations (within cooldown period)
-    active_escalations = {}
-    for (issue_key, level), timestamp in history.last_escalations.items():
-        time_diff = now - timestamp
-        if time_diff.total_seconds() < cooldown_hours * 3600:
-            if issue_key not in active_escalations:
-                active_escalations[issue_key] = []
+    # Find active escalations (within cooldown period), grouped by issue in one pass
+    active_escalations = defaultdict(list)
+    for (issue_key, level), timestamp in last_escalations.items():
+        if timestamp > cutoff:
             active_escalations[issue_key].append((level, timestamp))
     
     if not active_escalations:
         print(f"No active escalations found (within {cooldown_hours} hour cooldown).")
         return
     
-    print(f"Active escalations for {len(active_escalations)} issues:")
+    out = [f"Active escalations for {len(active_escalations)} issues:"]
+    
+    first_seen_for = history.get_all_first_seen().get
     
-    for issue_key, escalations in sorted(active_escalations.items()):
+    for issue_key, escalations in sorted(active_escalations.items(), key=_KEY0):
         # Sort by level
-        escalations.sort(key=lambda x: x[0])
+        escalations.sort(key=_KEY0)
         
-        days_since = history.get_days_since_first_escalation(issue_key) or 0
-        highest_level = max(level for level, _ in escalations)
+        first_seen = first_seen_for(issue_key)
+        days_since = int((now - first_seen) // 86400) if first_seen else 0
+        highest_level = escalations[-1][0]  # Sorted by level above
         
-        print(f"\n{issue_key} (Day {days_since}, highest level: {highest_level}):")
+        out.append(f"\n{issue_key} (Day {days_since}, highest level: {highest_level}):")
         
         for level, timestamp in escalations:
             time_ago = now - timestamp
-            if time_ago.total_seconds() < 60:
-                time_str = f"{int(time_ago.total_seconds())} seconds ago"
-            elif time_ago.total_seconds() < 3600:
-                time_str = f"{int(time_ago.total_seconds() / 60)} minutes ago"
-            else:
-                time_str = f"{int(time_ago.total_seconds() / 3600)} hours ago"
+            # Active escalations are bounded by the cooldown, so hours is the largest unit
+            time_str = _format_time_ago(time_ago, _TIME_UNITS[1:])
             
             # Calculate when this escalation expires
-            expires_in = cooldown_hours - (time_ago.total_seconds() / 3600)
+            expires_in = (cooldown - time_ago) / 3600
             if expires_in < 1:
                 expires_str = f"{int(expires_in * 60)} minutes"
             else:
                 expires_str = f"{int(expires_in)} hours"
             
-            print(f"  Level {level}: {timestamp.strftime('%H:%M:%S')} ({time_str}, expires in {expires_str})")
+            escalated_at = datetime.datetime.fromtimestamp(timestamp)
+            out.append(f"  Level {level}: {escalated_at.strftime('%H:%M:%S')} ({time_str}, expires in {expires_str})")
+    
+    _write_lines(out)
 
 def dry_run(config: Config) -> int:
     """Perform a dry run without actually escalating issues."""
-    from escalate.models import Rule
+    from escalate.escalator import Escalator
     
     # Create the escalator
-    escalator = Escalator(config)
-    
-    # Group rules by level
-    rules_by_level = {}
-    for rule in escalator.load_rules():
-        if rule.level not in rules_by_level:
-            rules_by_level[rule.level] = []
-        rules_by_level[rule.level].append(rule)
-    
-    total_would_escalate = 0
-    
-    print("Dry run results:")
-    
-    # Process each level of rules
-    for level in sorted(rules_by_level.keys()):
-        print(f"\n=== LEVEL {level} Rules ===")
-        rules = rules_by_level[level]
+    with Escalator(config) as escalator:
+        # Group rules by level
+        rules_by_level = {}
+        for rule in escalator.load_rules():
+            if rule.level not in rules_by_level:
+                rules_by_level[rule.level] = []
+            rules_by_level[rule.level].append(rule)
         
-        for rule in rules:
-            print(f"\nProcessing rule: {rule.name or rule.jql}")
-            
-            # Find issues matching the rule
-            issues = escalator.jira_client.find_issues_for_rule(rule)
-            
-            if not issues:
-                print(f"  No issues found matching rule")
-                continue
-            
-            print(f"  Found {len(issues)} potential issues")
-            
-            # Filter issues based on days_to_activate and escalation history
-            eligible_issues = escalator.filter_eligible_issues(issues, rule)
-            
-            if not eligible_issues:
-                print(f"  No eligible issues to escalate")
-                continue
+        total_would_escalate = 0
+        
+        out = ["Dry run results:"]
+        
+        # Process each level of rules
+        for level in sorted(rules_by_level.keys()):
+            out.append(f"\n=== LEVEL {level} Rules ===")
+            rules = rules_by_level[level]
             
-            print(f"  Would escalate {len(eligible_issues)} issues:")
+            # Rules in a level are independent, so search for their issues concurrently;
+            # map() yields results in rule order, keeping the output deterministic
+            with ThreadPoolExecutor(max_workers=min(DRY_RUN_MAX_WORKERS, len(rules))) as executor:
+                issues_by_rule = list(executor.map(escalator.jira_client.find_issues_for_rule, rules))
             
-            for issue in eligible_issues:
-                print(f"    - {issue['key']}: {issue['summary']}")
-                print(f"      Status: {issue['status']} for {issue['time_in_status_minutes']:.1f} minutes")
+            for rule, issues in zip(rules, issues_by_rule):
+                out.append(f"\nProcessing rule: {rule.name or rule.jql}")
                 
-                # If there are escalation paths, list them
-                for path in rule.escalation_paths:
-                    print(f"      Would send {path.type.value} to {path.recipient}")
+                if not issues:
+                    out.append(f"  No issues found matching rule")
+                    continue
                 
-                total_would_escalate += 1
-    
-    print(f"\nTotal: Would escalate {total_would_escalate} issues")
-    return total_would_escalate
+                out.append(f"  Found {len(issues)} potential issues")
+                
+                # Filter issues based on days_to_activate and escalation history
+                eligible_issues = escalator.filter_eligible_issues(issues, rule)
+                
+                if not eligible_issues:
+                    out.append(f"  No eligible issues to escalate")
+                    continue
+                
+                out.append(f"  Would escalate {len(eligible_issues)} issues:")
+                
+                for issue in eligible_issues:
+                    out.append(f"    - {issue['key']}: {issue['summary']}")
+                    out.append(f"      Status: {issue['status']} for {issue['time_in_status_minutes']:.1f} minutes")
+                    
+                    # If there are escalation paths, list them
+                    for path in rule.escalation_paths:
+                        out.append(f"      Would send {path.type.value} to {path.recipient}")
+                    
+                    total_would_escalate += 1
+        
+        out.append(f"\nTotal: Would escalate {total_would_escalate} issues")
+        _write_lines(out)
+        return total_would_escalate
 
 def main() -> int:
     """Main entry point for the command-line interface."""
     args = parse_args()
     
+    # Informational commands only read local files, so they only need to report problems
+    informational = (
+        args.list_rules or args.show_history or args.clear_history
+        or args.clear_history_for or args.list_active_escalations
+    )
+    
     # Configure logging
-    log_level = "DEBUG" if args.verbose else "INFO"
+    if args.verbose:
+        log_level = "DEBUG"
+    else:
+        log_level = "WARNING" if informational else "INFO"
     configure_logging(log_level)
     
+    # Bail out before touching the environment if there is no config file to load
+    if not os.path.exists(args.config):
+        logger.error(f"Config file not found: {args.config} (use -c to specify a config file)")
+        return 1
+    
     try:
         # Load configuration
         config = Config(args.config)
@@ -322,15 +351,15 @@ def main() -> int:
             logger.error("Invalid configuration. Please check your config file and environment variables.")
             return 1
         
-        # Create escalator
-        escalator = Escalator(config)
-        
         if args.dry_run:
             logger.info("Performing dry run...")
             return dry_run(config)
         
-        # Process rules
-        escalated_count = escalator.process_rules()
+        from escalate.escalator import Escalator
+        
+        # Create escalator and process rules
+        with Escalator(config) as escalator:
+            escalated_count = escalator.process_rules()
         
         logger.info(f"Escalated {escalated_count} issues")
         return 0
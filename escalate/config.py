@@ -1,17 +1,68 @@
 """Configuration management for the escalate tool."""
 import os
 import json
-from typing import Dict, List, Any, Optional
-from dotenv import load_dotenv
+import functools
+import logging
+from collections import defaultdict
+from typing import IO, Dict, List, Any, Optional, Union
+
+from escalate.models import Rule
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# A config file path, an open config file, or already-parsed config data
+ConfigSource = Union[str, IO, Dict[str, Any]]
+
+
+def _parse_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a JSON config file, using orjson when it is installed."""
+    with open(config_path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _load_dotenv() -> None:
+    """Load environment variables from a .env file, importing python-dotenv lazily."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Read and parse a JSON config file.
+    
+    Parsed files are memoised in-process, keyed by the file's mtime and size,
+    so reloading an unchanged config file skips JSON parsing. The returned
+    dict may be shared and must not be mutated.
+    Set ESCALATE_DISABLE_CONFIG_CACHE=1 to always re-read the file.
+    """
+    if os.getenv("ESCALATE_DISABLE_CONFIG_CACHE") == "1":
+        return _parse_config_file(config_path)
+    
+    st = os.stat(config_path)
+    return _load_config_cached(os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file; the mtime and size only key the cache."""
+    return _parse_config_file(config_path)
 
-# Load environment variables from .env file
-load_dotenv()
 
 class Config:
     """Configuration class for the escalate tool."""
     
-    def __init__(self, config_path: str = None):
-        """Initialize the config from a file or environment variables."""
+    def __init__(self, source: Optional[ConfigSource] = None):
+        """Initialize the config from a file, file-like object, dict or environment variables."""
+        # Only look for a .env file when the environment isn't already configured
+        if not os.getenv("JIRA_URL"):
+            _load_dotenv()
+        
         self.jira_url = os.getenv("JIRA_URL")
         self.jira_username = os.getenv("JIRA_USERNAME")
         self.jira_api_token = os.getenv("JIRA_API_TOKEN")
@@ -34,19 +85,37 @@ class Config:
         # Hours between same level escalations (default: 24 hours)
         self.escalation_cooldown_hours = int(os.getenv("ESCALATION_COOLDOWN_HOURS", "24"))
         
+        # Issues escalated in parallel per rule; keeps Slack/JIRA calls under rate limits
+        self.max_concurrency = int(os.getenv("ESCALATE_MAX_CONCURRENCY", "4"))
+        
         # Rules configuration
-        self.rules: List[Dict[str, Any]] = []
+        self.rules: List[Rule] = []
         
-        # Load rules from config file if provided
-        if config_path:
-            self.load_config(config_path)
+        # Load rules from the config source if provided
+        if source:
+            self.load_config(source)
     
-    def load_config(self, config_path: str) -> None:
-        """Load configuration from a JSON file."""
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+    def load_config(self, source: ConfigSource) -> None:
+        """
+        Load configuration from a JSON file path, an open JSON file or a dict.
+        
+        Only file paths go through the parse cache; dicts are used as they are
+        and are not modified.
+        """
+        if isinstance(source, dict):
+            config_data = source
+        elif hasattr(source, "read"):
+            config_data = _json_loads(source.read())
+        else:
+            config_data = _read_config_file(source)
             
-        self.rules = config_data.get("rules", [])
+        # Parse rules once up front; building new objects also keeps the
+        # (possibly cached) parsed data from ever being mutated
+        self.rules = [Rule.from_dict(rule_data) for rule_data in config_data.get("rules", [])]
+        
+        # Drop values derived from the previous configuration
+        self.__dict__.pop("rules_by_level", None)
+        self.__dict__.pop("history_file_path", None)
         
         # Override env vars with config file values if they exist
         for key, value in config_data.items():
@@ -65,20 +134,19 @@ class Config:
             
         return True
     
-    def get_rules_by_level(self) -> Dict[int, List[Dict[str, Any]]]:
-        """Group rules by their escalation level."""
-        rules_by_level = {}
+    @functools.cached_property
+    def rules_by_level(self) -> Dict[int, List[Rule]]:
+        """Rules grouped by their escalation level."""
+        rules_by_level = defaultdict(list)
         
         for rule in self.rules:
-            level = rule.get("level", 1)
-            if level not in rules_by_level:
-                rules_by_level[level] = []
-            rules_by_level[level].append(rule)
+            rules_by_level[rule.level].append(rule)
             
-        return rules_by_level
+        return dict(rules_by_level)
         
-    def get_history_file_path(self) -> str:
-        """Get the full path to the escalation history file."""
+    @functools.cached_property
+    def history_file_path(self) -> str:
+        """The full path to the escalation history file."""
         # If it's an absolute path, use it as is
         if os.path.isabs(self.history_file):
             return self.history_file
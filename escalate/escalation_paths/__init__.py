@@ -1,9 +1,16 @@
 """Escalation path implementations."""
+import importlib
+
 from escalate.escalation_paths.base import EscalationPath
-from escalate.escalation_paths.jira_comment import JiraCommentEscalationPath
-from escalate.escalation_paths.slack_dm import SlackDMEscalationPath
-from escalate.escalation_paths.pagerduty import PagerDutyEscalationPath
-from escalate.escalation_paths.email import EmailEscalationPath
+
+# Backend modules pull in their client libraries (slack_sdk, pdpyras, smtplib, ...),
+# so they are only imported the first time one of their classes is accessed.
+_LAZY_PATHS = {
+    'JiraCommentEscalationPath': 'escalate.escalation_paths.jira_comment',
+    'SlackDMEscalationPath': 'escalate.escalation_paths.slack_dm',
+    'PagerDutyEscalationPath': 'escalate.escalation_paths.pagerduty',
+    'EmailEscalationPath': 'escalate.escalation_paths.email',
+}
 
 # Export all escalation paths
 __all__ = [
@@ -12,4 +19,19 @@ __all__ = [
     'SlackDMEscalationPath',
     'PagerDutyEscalationPath',
     'EmailEscalationPath',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import escalation path backends on first access."""
+    module_name = _LAZY_PATHS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
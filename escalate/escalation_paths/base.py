@@ -1,6 +1,6 @@
 """Base escalation path implementation."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from escalate.models import EscalationEvent
 
@@ -8,6 +8,43 @@ from escalate.models import EscalationEvent
 class EscalationPath(ABC):
     """Base class for escalation paths."""
     
+    # Message used when an escalation path has no message_template
+    _DEFAULT_TEMPLATE = """
+Issue {issue_key}: {issue_summary}
+Status: {status}
+Time in status: {time_in_status_minutes:.1f} minutes
+Max time allowed: {max_time_in_status_minutes} minutes
+            """
+    
+    def __enter__(self) -> "EscalationPath":
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def open(self) -> None:
+        """
+        Start a batch of escalations.
+        
+        Paths that can reuse connections across escalations override this;
+        the default is a no-op.
+        """
+        pass
+    
+    def close(self) -> None:
+        """End a batch of escalations and release any held resources."""
+        pass
+    
+    def flush(self) -> List[EscalationEvent]:
+        """
+        Deliver escalations held back since open(), for paths that batch them.
+        
+        Returns the events that turned out to fail; each has successful set to
+        False and an error_message. The default holds nothing back.
+        """
+        return []
+    
     @abstractmethod
     def escalate(self, event: EscalationEvent) -> bool:
         """
@@ -19,16 +56,7 @@ class EscalationPath(ABC):
     
     def format_message(self, event: EscalationEvent) -> str:
         """Format the escalation message using the template if provided."""
-        template = event.escalation_path.message_template
-        
-        if not template:
-            # Default template
-            template = """
-Issue {issue_key}: {issue_summary}
-Status: {status}
-Time in status: {time_in_status_minutes:.1f} minutes
-Max time allowed: {max_time_in_status_minutes} minutes
-            """
+        template = event.escalation_path.message_template or self._DEFAULT_TEMPLATE
         
         # Format the template with issue data
         return template.format(
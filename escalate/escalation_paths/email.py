@@ -1,14 +1,19 @@
 """Email escalation path."""
 import logging
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from email.message import EmailMessage
 
 from escalate.models import EscalationEvent
 from escalate.escalation_paths.base import EscalationPath
 
 logger = logging.getLogger(__name__)
 
+_SUBJECT_FMT = "Issue Escalation: {key} - {summary}"
+
+# Port for implicit-TLS SMTP, which needs SMTP_SSL rather than STARTTLS
+SMTP_SSL_PORT = 465
+
 class EmailEscalationPath(EscalationPath):
     """Escalation path that sends an email."""
     
@@ -18,30 +23,93 @@ class EmailEscalationPath(EscalationPath):
         self.password = password
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        
+        # Authenticated connection shared by all sends between open() and close()
+        self._server = None
+        self._in_session = False
+        self._lock = threading.Lock()
+    
+    def open(self) -> None:
+        """Reuse one SMTP connection for every email sent until close()."""
+        self._in_session = True
+    
+    def close(self) -> None:
+        """Close the shared SMTP connection, if one was opened."""
+        self._in_session = False
+        with self._lock:
+            self._disconnect()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a connection to the SMTP server."""
+        if self.smtp_port == SMTP_SSL_PORT:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.starttls()  # Secure the connection
+        
+        server.login(self.sender, self.password)
+        return server
+    
+    def _disconnect(self) -> None:
+        """Drop the shared SMTP connection."""
+        if self._server is None:
+            return
+        
+        try:
+            self._server.quit()
+        except Exception as e:
+            logger.debug(f"Error closing SMTP connection: {str(e)}")
+        finally:
+            self._server = None
+    
+    def _send_shared(self, email: EmailMessage) -> None:
+        """Send over the shared connection, reconnecting once if the server dropped it."""
+        reused = self._server is not None
+        
+        try:
+            # Connect on first use and keep the connection for later emails
+            if self._server is None:
+                self._server = self._connect()
+            self._server.send_message(email)
+            return
+        except (smtplib.SMTPException, OSError):
+            # The shared connection may be broken; drop it either way
+            self._disconnect()
+            if not reused:
+                raise
+        except Exception:
+            self._disconnect()
+            raise
+        
+        # An idle connection the server has closed; retry once on a fresh one
+        self._server = self._connect()
+        try:
+            self._server.send_message(email)
+        except Exception:
+            self._disconnect()
+            raise
     
     def escalate(self, event: EscalationEvent) -> bool:
         """Send an email to the recipient."""
         message = self.format_message(event)
         recipient = event.escalation_path.recipient
         
-        # Create email
-        email = MIMEMultipart()
+        # Create a plain-text email
+        email = EmailMessage()
         email["From"] = self.sender
         email["To"] = recipient
-        email["Subject"] = f"Issue Escalation: {event.issue_key} - {event.issue_summary}"
-        
-        # Attach message body
-        email.attach(MIMEText(message, "plain"))
+        email["Subject"] = _SUBJECT_FMT.format(key=event.issue_key, summary=event.issue_summary)
+        email.set_content(message)
         
         try:
-            # Connect to the SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()  # Secure the connection
-            server.login(self.sender, self.password)
-            
-            # Send email
-            server.send_message(email)
-            server.quit()
+            if self._in_session:
+                # The shared connection carries one conversation at a time
+                with self._lock:
+                    self._send_shared(email)
+            else:
+                server = self._connect()
+                server.send_message(email)
+                server.quit()
             
             logger.info(f"Sent email to {recipient} about {event.issue_key}")
             return True
@@ -1,5 +1,7 @@
 """PagerDuty escalation path."""
 import logging
+from typing import Dict, Optional
+
 from pdpyras import EventsAPISession, APISession
 
 from escalate.models import EscalationEvent
@@ -15,6 +17,26 @@ class PagerDutyEscalationPath(EscalationPath):
         self.events_session = EventsAPISession(api_key)
         self.api_session = APISession(api_key)
         self.service_id = service_id
+        
+        # Email -> PagerDuty user ID, for users that were found
+        self._user_ids: Dict[str, str] = {}
+    
+    def _user_id_for(self, email: str) -> Optional[str]:
+        """
+        Look up a PagerDuty user ID by email.
+        
+        Only users that were found are cached; a user who is missing or whose
+        lookup failed is looked up again next time, since they may be added or
+        the error may pass.
+        """
+        user_id = self._user_ids.get(email)
+        if user_id is None:
+            users = self.api_session.rget("users", params={"query": email})
+            if not users:
+                return None
+            user_id = self._user_ids[email] = users[0]["id"]
+        
+        return user_id
     
     def escalate(self, event: EscalationEvent) -> bool:
         """Create a PagerDuty incident."""
@@ -47,20 +69,20 @@ class PagerDutyEscalationPath(EscalationPath):
             if event.escalation_path.recipient:
                 try:
                     # Find the incident that was just created using dedup_key
-                    incidents = self.api_session.list_all(
-                        "incidents", 
-                        params={"statuses[]": ["triggered"], "service_ids[]": [self.service_id]}
+                    incidents = self.api_session.rget(
+                        "incidents",
+                        params={
+                            "incident_key": dedup_key,
+                            "statuses[]": ["triggered"],
+                            "service_ids[]": [self.service_id]
+                        }
                     )
                     
                     # Find the user by email
-                    users = self.api_session.list_all(
-                        "users", 
-                        params={"query": event.escalation_path.recipient}
-                    )
+                    user_id = self._user_id_for(event.escalation_path.recipient)
                     
-                    if incidents and users:
+                    if incidents and user_id:
                         incident_id = incidents[0]["id"]
-                        user_id = users[0]["id"]
                         
                         # Assign the incident
                         self.api_session.put(
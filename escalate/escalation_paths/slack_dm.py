@@ -1,5 +1,10 @@
 """Slack DM escalation path."""
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
@@ -8,29 +13,101 @@ from escalate.escalation_paths.base import EscalationPath
 
 logger = logging.getLogger(__name__)
 
+# How long a resolved DM channel is reused before it is looked up again
+DM_CHANNEL_TTL_SECONDS = 600
+
+# Concurrent conversations.open calls made when pre-opening DM channels
+PREWARM_MAX_WORKERS = 8
+
+# Separator between escalations combined into one DM, and Slack's message size limit
+MESSAGE_SEPARATOR = "\n\n---\n\n"
+MAX_MESSAGE_CHARS = 40000
+
 class SlackDMEscalationPath(EscalationPath):
     """Escalation path that sends a Slack DM."""
     
     def __init__(self, slack_token: str):
         """Initialize with a Slack API token."""
         self.client = WebClient(token=slack_token)
+        
+        # Recipient -> (DM channel ID, monotonic time it was resolved)
+        self._dm_channel_cache: Dict[str, Tuple[str, float]] = {}
+        
+        # Events and their messages held per recipient between open() and flush(),
+        # sent as one DM
+        self._pending: Dict[str, List[Tuple[EscalationEvent, str]]] = {}
+        self._pending_lock = threading.Lock()
+        self._in_session = False
+    
+    def open(self) -> None:
+        """Hold DMs until flush() or close() and send each recipient a single combined message."""
+        self._in_session = True
+    
+    def close(self) -> None:
+        """Send the held DMs."""
+        self._in_session = False
+        self.flush()
+    
+    def _get_dm_channel(self, recipient: str) -> Tuple[str, bool]:
+        """
+        Get the DM channel for a recipient, opening it if needed.
+        
+        Returns a (channel_id, from_cache) tuple.
+        """
+        cached = self._dm_channel_cache.get(recipient)
+        if cached is not None and time.monotonic() - cached[1] < DM_CHANNEL_TTL_SECONDS:
+            return cached[0], True
+        
+        response = self.client.conversations_open(users=recipient)
+        channel_id = response["channel"]["id"]
+        self._dm_channel_cache[recipient] = (channel_id, time.monotonic())
+        return channel_id, False
+    
+    def prewarm(self, recipients: Iterable[str]) -> None:
+        """
+        Open DM channels for several recipients concurrently.
+        
+        Recipients with a fresh cached channel are skipped. Failures are only
+        logged here; they are reported properly when the DM is sent.
+        """
+        now = time.monotonic()
+        pending = [
+            recipient for recipient in set(recipients)
+            if recipient not in self._dm_channel_cache
+            or now - self._dm_channel_cache[recipient][1] >= DM_CHANNEL_TTL_SECONDS
+        ]
+        
+        if not pending:
+            return
+        
+        def open_channel(recipient: str) -> None:
+            # Nothing is cached on failure, so sending the DM opens the channel again
+            try:
+                self._get_dm_channel(recipient)
+            except Exception as e:
+                logger.debug(f"Could not pre-open Slack DM channel for {recipient}: {str(e)}")
+        
+        with ThreadPoolExecutor(max_workers=min(PREWARM_MAX_WORKERS, len(pending))) as executor:
+            for _ in executor.map(open_channel, pending):
+                pass
     
     def escalate(self, event: EscalationEvent) -> bool:
-        """Send a Slack DM to the recipient."""
+        """
+        Send a Slack DM to the recipient.
+        
+        Between open() and close() the message is only queued and True is
+        returned; flush() sends it and reports the events that failed.
+        """
         message = self.format_message(event)
         recipient = event.escalation_path.recipient
         
+        if self._in_session:
+            with self._pending_lock:
+                self._pending.setdefault(recipient, []).append((event, message))
+            return True
+        
         try:
-            # Open a DM channel
-            response = self.client.conversations_open(users=recipient)
-            channel_id = response["channel"]["id"]
-            
-            # Send the message
-            self.client.chat_postMessage(
-                channel=channel_id,
-                text=message
-            )
-            
+            self._send(recipient, message)
             logger.info(f"Sent Slack DM to {recipient} about {event.issue_key}")
             return True
             
@@ -38,4 +115,85 @@ class SlackDMEscalationPath(EscalationPath):
             error_message = f"Failed to send Slack DM to {recipient}: {str(e)}"
             logger.error(error_message)
             event.error_message = error_message
-            return False
\ No newline at end of file
+            return False
+    
+    def flush(self) -> List[EscalationEvent]:
+        """
+        Send each recipient's queued messages as one DM, split to fit Slack's size limit.
+        
+        Returns the events whose DM could not be sent, marked as failed.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        
+        failed = []
+        for recipient, queued in pending.items():
+            events = [event for event, _ in queued]
+            recipient_failed = []
+            start = 0
+            for chunk, count in _combine_messages([message for _, message in queued]):
+                chunk_events = events[start:start + count]
+                start += count
+                
+                # Network errors are failures too; one must not abort the rest of the run
+                try:
+                    self._send(recipient, chunk)
+                except Exception as e:
+                    error_message = f"Failed to send Slack DM to {recipient}: {str(e)}"
+                    logger.error(error_message)
+                    for event in chunk_events:
+                        event.successful = False
+                        event.error_message = error_message
+                    recipient_failed.extend(chunk_events)
+            
+            if len(recipient_failed) < len(events):
+                logger.info(f"Sent Slack DM to {recipient} about {len(events) - len(recipient_failed)} escalations")
+            failed.extend(recipient_failed)
+        
+        return failed
+    
+    def _send(self, recipient: str, message: str) -> None:
+        """Post a message to a recipient's DM channel, raising SlackApiError on failure."""
+        # Open (or reuse) a DM channel
+        channel_id, from_cache = self._get_dm_channel(recipient)
+        
+        # Send the message
+        try:
+            self.client.chat_postMessage(
+                channel=channel_id,
+                text=message
+            )
+        except SlackApiError:
+            if not from_cache:
+                raise
+            
+            # The cached channel may be stale; look it up again and retry once
+            self._dm_channel_cache.pop(recipient, None)
+            channel_id, _ = self._get_dm_channel(recipient)
+            self.client.chat_postMessage(
+                channel=channel_id,
+                text=message
+            )
+
+
+def _combine_messages(messages: List[str]) -> Iterable[Tuple[str, int]]:
+    """
+    Join messages with MESSAGE_SEPARATOR into as few chunks as fit MAX_MESSAGE_CHARS.
+    
+    Yields (chunk, number of messages in it) tuples, in order.
+    """
+    chunk: List[str] = []
+    size = 0
+    
+    for message in messages:
+        added = len(message) + (len(MESSAGE_SEPARATOR) if chunk else 0)
+        if chunk and size + added > MAX_MESSAGE_CHARS:
+            yield MESSAGE_SEPARATOR.join(chunk), len(chunk)
+            chunk, size = [], 0
+            added = len(message)
+        
+        chunk.append(message)
+        size += added
+    
+    if chunk:
+        yield MESSAGE_SEPARATOR.join(chunk), len(chunk)
\ No newline at end of file
@@ -1,13 +1,18 @@
 """Main escalation logic."""
 import logging
 import os
-from typing import Dict, List, Any, Set, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from typing import Dict, List, Any, Set, Optional, Tuple
 from datetime import datetime, timedelta
 
 from escalate.config import Config
 from escalate.jira_client import JiraClient
+from escalate.jql import normalize_jql
 from escalate.models import Rule, EscalationEvent, EscalationPathConfig, EscalationPathType, EscalationHistory
 from escalate.escalation_paths import (
+    EscalationPath,
     JiraCommentEscalationPath,
     SlackDMEscalationPath,
     PagerDutyEscalationPath,
@@ -43,16 +48,41 @@ class Escalator:
             ) if config.email_sender and config.email_password else None
         }
         
+        # Only the configured handlers, for dispatch in the escalation loop
+        self._active_paths = {
+            path_type: handler for path_type, handler in self.escalation_paths.items()
+            if handler is not None
+        }
+        
         # Initialize Sumo Logic logger
         self.sumo_logger = SumoLogicHandler(config.sumo_endpoint_url) if config.sumo_endpoint_url else None
         
         # Initialize escalation history tracker
-        history_path = config.get_history_file_path()
+        history_path = config.history_file_path
         self.history = EscalationHistory(history_path)
+        self._history_lock = threading.Lock()
+        self._clock = self.history.clock
+        
+        # (issue key, path type, recipient, template) of notifications sent this run
+        self._sent: Set[Tuple[str, EscalationPathType, str, Optional[str]]] = set()
+        self._sent_lock = threading.Lock()
+    
+    def __enter__(self) -> "Escalator":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release network and storage resources held by the escalator."""
+        if self.sumo_logger:
+            self.sumo_logger.close()
+        
+        self.history.close()
     
     def load_rules(self) -> List[Rule]:
         """Load rules from configuration."""
-        return [Rule.from_dict(rule_data) for rule_data in self.config.rules]
+        return list(self.config.rules)
     
     def process_rules(self) -> int:
         """
@@ -60,6 +90,20 @@ class Escalator:
         
         Returns the number of issues escalated.
         """
+        # Status histories are only reused within a single run
+        self.jira_client.reset_cache()
+        self._sent = set()
+        
+        # Read the clock once; every history check in this run uses the same time.
+        # The live clock is restored even if the run fails part way.
+        self.history.clock = self._clock.snapshot()
+        try:
+            return self._process_rules()
+        finally:
+            self.history.clock = self._clock
+    
+    def _process_rules(self) -> int:
+        """Run every rule once against the history clock's current time."""
         # Group rules by level for later use
         rules_by_level = {}
         for rule in self.load_rules():
@@ -69,40 +113,107 @@ class Escalator:
         
         total_escalated = 0
         
-        # Process each level of rules
-        for level in sorted(rules_by_level.keys()):
-            rules = rules_by_level[level]
+        # Search results shared by every rule with the same JQL during this run
+        search_results: Dict[Tuple[str, Optional[int]], List[Dict[str, Any]]] = {}
+        
+        # A shared search can only leave out issues that no rule using it would escalate
+        search_thresholds: Dict[Tuple[str, Optional[int]], int] = {}
+        for rules in rules_by_level.values():
             for rule in rules:
-                logger.info(f"Processing rule: {rule.name or rule.jql} (Level {rule.level})")
-                
-                # Find issues matching the rule
-                issues = self.jira_client.find_issues_for_rule(rule)
-                
-                if not issues:
-                    logger.info(f"No issues found matching rule: {rule.name or rule.jql}")
-                    continue
-                
-                logger.info(f"Found {len(issues)} potential issues for rule: {rule.name or rule.jql}")
-                
-                # Filter issues based on days_to_activate and escalation history
-                eligible_issues = self.filter_eligible_issues(issues, rule)
-                
-                if not eligible_issues:
-                    logger.info(f"No eligible issues to escalate for rule: {rule.name or rule.jql}")
-                    continue
-                
-                logger.info(f"Found {len(eligible_issues)} eligible issues to escalate for rule: {rule.name or rule.jql}")
-                
-                # Escalate each eligible issue
-                for issue in eligible_issues:
-                    escalated = self.escalate_issue(issue, rule)
-                    if escalated:
-                        total_escalated += 1
-                        # Record this escalation in history to prevent duplicates
-                        self.history.record_escalation(issue["key"], rule.level)
+                search_key = (normalize_jql(rule.jql), rule.max_results)
+                search_thresholds[search_key] = min(
+                    search_thresholds.get(search_key, rule.max_time_in_status_minutes),
+                    rule.max_time_in_status_minutes
+                )
+        
+        # Keep escalation paths open for the whole run so connections are reused
+        with self._open_escalation_paths():
+            # Process each level of rules
+            for level in sorted(rules_by_level.keys()):
+                rules = rules_by_level[level]
+                for rule in rules:
+                    logger.info(f"Processing rule: {rule.name or rule.jql} (Level {rule.level})")
+                    
+                    # Find issues matching the rule, searching JIRA once per distinct query;
+                    # queries that differ only in spacing or keyword case count as one
+                    search_key = (normalize_jql(rule.jql), rule.max_results)
+                    if search_key not in search_results:
+                        search_results[search_key] = self.jira_client.search(
+                            rule.jql, rule.max_results, search_thresholds[search_key]
+                        )
+                    issues = self.jira_client.filter_by_max_time(
+                        search_results[search_key], rule.max_time_in_status_minutes
+                    )
+                    
+                    if not issues:
+                        logger.info(f"No issues found matching rule: {rule.name or rule.jql}")
+                        continue
+                    
+                    logger.info(f"Found {len(issues)} potential issues for rule: {rule.name or rule.jql}")
+                    
+                    # Filter issues based on days_to_activate and escalation history
+                    eligible_issues = self.filter_eligible_issues(issues, rule)
+                    
+                    if not eligible_issues:
+                        logger.info(f"No eligible issues to escalate for rule: {rule.name or rule.jql}")
+                        continue
+                    
+                    logger.info(f"Found {len(eligible_issues)} eligible issues to escalate for rule: {rule.name or rule.jql}")
+                    
+                    # Open the rule's Slack DM channels up front rather than one by one
+                    self._prewarm_slack(rule)
+                    
+                    # Escalate eligible issues in parallel, bounded to respect API rate limits
+                    results = []
+                    with ThreadPoolExecutor(max_workers=max(1, self.config.max_concurrency)) as executor:
+                        futures = {
+                            executor.submit(self._send_issue, issue, rule): issue
+                            for issue in eligible_issues
+                        }
+                        for future in as_completed(futures):
+                            results.append((futures[future], *future.result()))
+                    
+                    # Deliver the rule's batched notifications (Slack DMs) before
+                    # anything is recorded, so failed ones aren't silenced by history
+                    self._flush_escalation_paths()
+                    
+                    for issue, already_sent, events in results:
+                        if self._finish_issue(already_sent, events):
+                            total_escalated += 1
+                            # Record this escalation in history to prevent duplicates
+                            with self._history_lock:
+                                self.history.record_escalation(issue["key"], rule.level)
+        
+        # Persist this run's escalations in a single write
+        with self._history_lock:
+            self.history.flush()
+        
+        # Wait for this run's escalation events to reach Sumo Logic
+        if self.sumo_logger:
+            self.sumo_logger.flush()
         
         return total_escalated
     
+    def _prewarm_slack(self, rule: Rule) -> None:
+        """Pre-open DM channels for the Slack recipients of a rule."""
+        slack_handler = self._active_paths.get(EscalationPathType.SLACK_DM)
+        if slack_handler is None:
+            return
+        
+        recipients = {
+            path_config.recipient for path_config in rule.escalation_paths
+            if path_config.type == EscalationPathType.SLACK_DM
+        }
+        if recipients:
+            slack_handler.prewarm(recipients)
+    
+    def _open_escalation_paths(self) -> ExitStack:
+        """Open every configured escalation path, returning a stack that closes them."""
+        with ExitStack() as stack:
+            for path_handler in self._active_paths.values():
+                stack.enter_context(path_handler)
+            return stack.pop_all()
+    
     def filter_eligible_issues(self, issues: List[Dict[str, Any]], rule: Rule) -> List[Dict[str, Any]]:
         """
         Filter issues based on escalation history and days_to_activate rules.
@@ -115,25 +226,30 @@ class Escalator:
             List of issues eligible for escalation
         """
         eligible_issues = []
-        cooldown_hours = self.config.escalation_cooldown_hours
+        # History timestamps are epoch seconds
+        cooldown = self.config.escalation_cooldown_hours * 3600
+        ever = 24*365 * 3600  # Window that counts as "ever escalated"
+        now = self.history.clock.now()
         
         for issue in issues:
             issue_key = issue["key"]
             
+            # Look the issue's history up once and evaluate every check against it
+            entry = self.history.get_entry(issue_key)
+            levels = entry["levels"] if entry else {}
+            
             # Check if this issue was recently escalated at this level
-            if self.history.was_recently_escalated(issue_key, rule.level, cooldown_hours):
+            last_time = levels.get(rule.level)
+            if last_time is not None and now - last_time < cooldown:
                 logger.info(f"Issue {issue_key} recently escalated at level {rule.level}, skipping")
                 continue
             
             # If this is not the first level, check previous levels have been escalated
             if rule.level > 1:
-                # Check if previous level was escalated
-                prev_level_escalated = False
-                for prev_level in range(1, rule.level):
-                    if not self.history.was_recently_escalated(issue_key, prev_level, 24*365):  # Check if ever escalated at prev level
-                        break
-                else:
-                    prev_level_escalated = True
+                prev_level_escalated = all(
+                    prev_level in levels and now - levels[prev_level] < ever
+                    for prev_level in range(1, rule.level)
+                )
                 
                 if not prev_level_escalated:
                     logger.info(f"Issue {issue_key} has not been escalated at all previous levels, skipping")
@@ -141,7 +257,7 @@ class Escalator:
             
             # Check days_to_activate rule
             if rule.days_to_activate > 0:
-                days_since_first = self.history.get_days_since_first_escalation(issue_key)
+                days_since_first = int((now - entry["first"]) // 86400) if entry else None
                 
                 # If never escalated before or not enough days have passed
                 if days_since_first is None or days_since_first < rule.days_to_activate:
@@ -153,20 +269,58 @@ class Escalator:
         
         return eligible_issues
     
+    def _flush_escalation_paths(self) -> None:
+        """Deliver notifications the escalation paths are holding back."""
+        for path_handler in self._active_paths.values():
+            # flush() marks the events it couldn't deliver as failed
+            path_handler.flush()
+    
     def escalate_issue(self, issue: Dict[str, Any], rule: Rule) -> bool:
         """
         Escalate a single issue.
         
+        Escalation paths backed by different handlers are sent concurrently, so
+        the time to escalate an issue is bounded by its slowest path rather than
+        the sum of all of them.
+        
+        A notification identical to one already sent this run (same issue, path
+        type, recipient and template) is not sent again; it counts as delivered.
+        
         Returns True if at least one escalation path was successful.
         """
-        any_successful = False
+        already_sent, events = self._send_issue(issue, rule)
+        self._flush_escalation_paths()
+        return self._finish_issue(already_sent, events)
+    
+    def _send_issue(self, issue: Dict[str, Any], rule: Rule) -> Tuple[bool, List[EscalationEvent]]:
+        """
+        Send an issue's notifications, except those already sent this run.
+        
+        Returns whether any were skipped as already sent, and the events for the
+        rest. Paths that batch may only have queued theirs; their outcome is
+        final once the paths are flushed.
+        """
+        # Group this issue's events by handler; each handler sends its events in order
+        events_by_handler: Dict[EscalationPath, List[EscalationEvent]] = {}
+        events = []
+        already_sent = False
         
         for path_config in rule.escalation_paths:
             # Skip if the escalation path is not configured
-            if self.escalation_paths[path_config.type] is None:
+            path_handler = self._active_paths.get(path_config.type)
+            if path_handler is None:
                 logger.warning(f"Escalation path {path_config.type.value} is not configured, skipping")
                 continue
             
+            # Skip notifications this run has already delivered
+            sent_key = (issue["key"], path_config.type, path_config.recipient, path_config.message_template)
+            with self._sent_lock:
+                if sent_key in self._sent:
+                    logger.info(f"Already escalated {issue['key']} to {path_config.recipient} via {path_config.type.value} this run, skipping")
+                    already_sent = True
+                    continue
+                self._sent.add(sent_key)
+            
             # Create the escalation event
             event = EscalationEvent(
                 issue_key=issue["key"],
@@ -178,27 +332,58 @@ class Escalator:
                 escalation_path=path_config,
                 level=rule.level  # Set the escalation level
             )
+            events.append(event)
+            events_by_handler.setdefault(path_handler, []).append(event)
+        
+        if len(events_by_handler) > 1:
+            with ThreadPoolExecutor(max_workers=len(events_by_handler)) as executor:
+                for _ in executor.map(self._send_events, events_by_handler.items()):
+                    pass
+        else:
+            for item in events_by_handler.items():
+                self._send_events(item)
+        
+        return already_sent, events
+    
+    def _finish_issue(self, already_sent: bool, events: List[EscalationEvent]) -> bool:
+        """
+        Log an issue's events once their outcome is final and release failed ones for retry.
+        
+        Returns True if the issue counts as escalated.
+        """
+        for event in events:
+            # Queue the event for the batched Sumo Logic upload if configured
+            if self.sumo_logger:
+                self.sumo_logger.enqueue(event)
+        
+        # Let failed notifications be retried by later rules in this run
+        with self._sent_lock:
+            for event in events:
+                if not event.successful:
+                    path_config = event.escalation_path
+                    self._sent.discard((event.issue_key, path_config.type, path_config.recipient, path_config.message_template))
+        
+        return already_sent or any(event.successful for event in events)
+    
+    def _send_events(self, item: Tuple[EscalationPath, List[EscalationEvent]]) -> None:
+        """Send a handler's escalation events, recording the outcome on each event."""
+        path_handler, events = item
+        
+        for event in events:
+            path_type = event.escalation_path.type.value
             
             # Execute the escalation
             try:
-                path_handler = self.escalation_paths[path_config.type]
                 success = path_handler.escalate(event)
                 event.successful = success
                 
                 if success:
-                    any_successful = True
-                    logger.info(f"Successfully escalated {issue['key']} via {path_config.type.value} at level {rule.level}")
+                    logger.info(f"Successfully escalated {event.issue_key} via {path_type} at level {event.level}")
                 else:
-                    logger.error(f"Failed to escalate {issue['key']} via {path_config.type.value}")
+                    logger.error(f"Failed to escalate {event.issue_key} via {path_type}")
                 
             except Exception as e:
-                error_message = f"Error escalating {issue['key']} via {path_config.type.value}: {str(e)}"
+                error_message = f"Error escalating {event.issue_key} via {path_type}: {str(e)}"
                 logger.error(error_message)
                 event.error_message = error_message
-                event.successful = False
-            
-            # Log to Sumo Logic if configured
-            if self.sumo_logger:
-                self.sumo_logger.log_escalation(event)
-        
-        return any_successful
\ No newline at end of file
+                event.successful = False
\ No newline at end of file
@@ -1,63 +1,200 @@
 """JIRA client for the escalate tool."""
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 import logging
 from jira import JIRA
 
+from escalate.jql import split_order_by
 from escalate.models import Rule, EscalationEvent, EscalationPathConfig, EscalationPathType
 
 logger = logging.getLogger(__name__)
 
+# Only the fields the escalation logic reads; the changelog is expanded inline
+# so status history doesn't cost an extra request per issue
+ISSUE_FIELDS = ["summary", "status", "assignee", "created"]
+
+# Issues fetched per search request; only one page of raw issues is held at a time
+SEARCH_PAGE_SIZE = 100
+
+def _add_time_in_status_filter(jql: str, minutes: int) -> str:
+    """
+    Narrow a JQL query to issues whose status hasn't changed in the last `minutes`.
+    
+    Those issues can't have been in their status long enough to escalate, so JIRA
+    can drop them before they are transferred. The client-side time check still
+    applies to everything that is returned.
+    """
+    # The filter has to go before a trailing ORDER BY clause
+    where, order_by = split_order_by(jql)
+    
+    time_filter = f'NOT status CHANGED AFTER "-{int(minutes)}m"'
+    if where:
+        time_filter = f"({where}) AND {time_filter}"
+    if order_by:
+        time_filter += " " + order_by
+    
+    return time_filter
+
 class JiraClient:
     """Client for interacting with JIRA."""
     
     def __init__(self, url: str, username: str, api_token: str):
         """Initialize the JIRA client."""
         self.jira = JIRA(server=url, basic_auth=(username, api_token))
+        
+        # Issue key -> parsed status history, shared by rules with overlapping JQL
+        self._status_history_cache: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def reset_cache(self) -> None:
+        """Forget status histories cached during a previous run."""
+        self._status_history_cache.clear()
     
     def find_issues_for_rule(self, rule: Rule) -> List[Dict[str, Any]]:
         """Find issues that match the JQL query in the rule."""
-        issues = []
+        issues = self.search(rule.jql, rule.max_results, rule.max_time_in_status_minutes)
+        return self.filter_by_max_time(issues, rule.max_time_in_status_minutes)
+    
+    def search(self, jql: str, max_results: Optional[int] = None,
+               min_time_in_status_minutes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find every issue matching a JQL query, with its time in the current status.
         
-        try:
-            jira_issues = self.jira.search_issues(rule.jql)
+        Args:
+            jql: The JQL query to run
+            max_results: Maximum number of issues to return (default: all matches)
+            min_time_in_status_minutes: If set, have JIRA skip issues whose status
+                changed more recently than this
             
-            for issue in jira_issues:
-                # Get the current status
-                status = issue.fields.status.name
-                
-                # Calculate time in status
-                status_history = self._get_status_history(issue.key)
-                time_in_status = self._calculate_time_in_status(status_history, status)
-                
-                # Convert to minutes
-                time_in_status_minutes = time_in_status.total_seconds() / 60
-                
-                # Check if we need to escalate
-                if time_in_status_minutes > rule.max_time_in_status_minutes:
-                    assignee = getattr(issue.fields, 'assignee', None)
-                    assignee_name = assignee.displayName if assignee else None
-                    
-                    issues.append({
-                        "key": issue.key,
-                        "summary": issue.fields.summary,
-                        "assignee": assignee_name,
-                        "status": status,
-                        "time_in_status_minutes": time_in_status_minutes
-                    })
+        Returns:
+            List of issue dicts in their status for longer than
+            min_time_in_status_minutes; callers still apply their own threshold
+        """
+        try:
+            issues = self.iter_issues(jql, max_results, min_time_in_status_minutes)
+            if not min_time_in_status_minutes:
+                return list(issues)
             
-            return issues
+            # Only candidates are kept as pages stream in; the JQL filter is
+            # approximate, so issues still under the threshold are dropped here
+            return self.filter_by_max_time(issues, min_time_in_status_minutes)
         
         except Exception as e:
-            logger.error(f"Error searching for issues with JQL '{rule.jql}': {str(e)}")
+            logger.error(f"Error searching for issues with JQL '{jql}': {str(e)}")
             return []
     
-    def _get_status_history(self, issue_key: str) -> List[Dict[str, Any]]:
-        """Get the status change history for an issue."""
+    def iter_issues(self, jql: str, max_results: Optional[int] = None,
+                    min_time_in_status_minutes: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the issues matching a JQL query, fetching them a page at a time.
+        
+        Takes the same arguments as search(), but yields each issue dict as its
+        page arrives and lets JIRA errors propagate.
+        """
+        if min_time_in_status_minutes:
+            search_jql = _add_time_in_status_filter(jql, min_time_in_status_minutes)
+        else:
+            search_jql = jql
+        
+        if self.jira.deploymentType == "Cloud":
+            pages = self._cloud_pages(search_jql, max_results)
+        else:
+            pages = self._server_pages(search_jql, max_results)
+        
+        for jira_issues in pages:
+            for issue in jira_issues:
+                yield self._to_issue_dict(issue)
+    
+    def _cloud_pages(self, jql: str, max_results: Optional[int]) -> Iterator[List[Any]]:
+        """
+        Yield pages of raw issues from Jira Cloud's enhanced search.
+        
+        Cloud rejects startAt paging and reports no total, so each page's
+        nextPageToken fetches the next one and its absence ends the search.
+        """
+        fetched = 0
+        next_page_token = None
+        while max_results is None or fetched < max_results:
+            page_size = SEARCH_PAGE_SIZE if max_results is None else min(SEARCH_PAGE_SIZE, max_results - fetched)
+            jira_issues = self.jira.enhanced_search_issues(
+                jql,
+                nextPageToken=next_page_token,
+                maxResults=page_size,
+                expand='changelog',
+                fields=ISSUE_FIELDS
+            )
+            yield jira_issues
+            
+            fetched += len(jira_issues)
+            next_page_token = jira_issues.nextPageToken
+            if not jira_issues or not next_page_token:
+                return
+    
+    def _server_pages(self, jql: str, max_results: Optional[int]) -> Iterator[List[Any]]:
+        """Yield pages of raw issues from Jira Server or Data Center, paging with startAt."""
+        start_at = 0
+        while max_results is None or start_at < max_results:
+            page_size = SEARCH_PAGE_SIZE if max_results is None else min(SEARCH_PAGE_SIZE, max_results - start_at)
+            jira_issues = self.jira.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=page_size,
+                expand='changelog',
+                fields=ISSUE_FIELDS
+            )
+            yield jira_issues
+            
+            # JIRA may return fewer issues than asked for (more so with the
+            # changelog expanded), so only the reported total, isLast or an
+            # empty page ends the search
+            start_at += len(jira_issues)
+            total = getattr(jira_issues, "total", None)
+            if not jira_issues or getattr(jira_issues, "isLast", None):
+                return
+            if total is not None:
+                if start_at >= total:
+                    return
+            elif len(jira_issues) < page_size:
+                # Without a total, a short page is the only sign of the end
+                return
+    
+    def _to_issue_dict(self, issue: Any) -> Dict[str, Any]:
+        """Extract what escalation needs from a JIRA issue, including its time in status."""
+        # Get the current status
+        status = issue.fields.status.name
+        
+        # Calculate time in status
+        status_history = self._get_status_history(issue)
+        time_in_status = self._calculate_time_in_status(status_history, status)
+        
+        assignee = getattr(issue.fields, 'assignee', None)
+        assignee_name = assignee.displayName if assignee else None
+        
+        return {
+            "key": issue.key,
+            "summary": issue.fields.summary,
+            "assignee": assignee_name,
+            "status": status,
+            # Convert to minutes
+            "time_in_status_minutes": time_in_status.total_seconds() / 60
+        }
+    
+    @staticmethod
+    def filter_by_max_time(issues: Iterable[Dict[str, Any]], max_time_in_status_minutes: int) -> List[Dict[str, Any]]:
+        """Keep the issues that have been in their current status for longer than the threshold."""
+        return [
+            issue for issue in issues
+            if issue["time_in_status_minutes"] > max_time_in_status_minutes
+        ]
+    
+    def _get_status_history(self, issue: Any) -> List[Dict[str, Any]]:
+        """Get the status change history for an issue fetched with its changelog."""
+        cached = self._status_history_cache.get(issue.key)
+        if cached is not None:
+            return cached
+        
         history = []
         
         try:
-            issue = self.jira.issue(issue_key, expand='changelog')
             changelog = issue.changelog
             
             for history_item in changelog.histories:
@@ -66,13 +203,13 @@ class JiraClient:
                         history.append({
                             'from': item.fromString,
                             'to': item.toString,
-                            'date': datetime.strptime(history_item.created[:19], "%Y-%m-%dT%H:%M:%S")
+                            'date': datetime.fromisoformat(history_item.created[:19])
                         })
             
             # Add the current status entry if there's no history
             if not history:
                 current_status = issue.fields.status.name
-                created_date = datetime.strptime(issue.fields.created[:19], "%Y-%m-%dT%H:%M:%S")
+                created_date = datetime.fromisoformat(issue.fields.created[:19])
                 
                 history.append({
                     'from': None,
@@ -80,10 +217,11 @@ class JiraClient:
                     'date': created_date
                 })
                 
+            self._status_history_cache[issue.key] = history
             return history
         
         except Exception as e:
-            logger.error(f"Error getting status history for issue {issue_key}: {str(e)}")
+            logger.error(f"Error getting status history for issue {issue.key}: {str(e)}")
             return []
     
     def _calculate_time_in_status(self, status_history: List[Dict[str, Any]], current_status: str) -> timedelta:
@@ -91,23 +229,18 @@ class JiraClient:
         if not status_history:
             return timedelta(0)
         
-        # Sort history by date
-        sorted_history = sorted(status_history, key=lambda x: x['date'])
-        
-        # Find the most recent transition to the current status
-        latest_transition = None
-        
-        for item in reversed(sorted_history):
-            if item['to'] == current_status:
-                latest_transition = item
-                break
+        # Find the most recent transition to the current status in a single pass
+        latest_transition = max(
+            (item['date'] for item in status_history if item['to'] == current_status),
+            default=None
+        )
         
-        if not latest_transition:
+        if latest_transition is None:
             # If we didn't find a transition to the current status, use the creation date
-            return datetime.now() - sorted_history[0]['date']
+            return datetime.now() - min(item['date'] for item in status_history)
         
         # Calculate time since the transition
-        return datetime.now() - latest_transition['date']
+        return datetime.now() - latest_transition
     
     def add_comment(self, issue_key: str, comment: str) -> bool:
         """Add a comment to a JIRA issue."""
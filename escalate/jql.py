@@ -0,0 +1,66 @@
+"""Normalize JQL queries so equivalent spellings can share one JIRA search."""
+import functools
+import re
+from typing import Tuple
+
+_TOKEN = re.compile(r'''\s*(?:"((?:[^"\\]|\\.)*)"|'((?:[^'\\]|\\.)*)'|(!=|!~|=|~|\(|\)|,)|([^\s=!~(),"']+))''')
+
+# Keywords whose case JIRA ignores, uppercased when normalizing a query
+_KEYWORDS = frozenset(["AND", "OR", "NOT", "IN", "IS", "EMPTY", "NULL", "ORDER", "BY", "ASC", "DESC"])
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_jql(jql: str) -> str:
+    """
+    Rewrite a JQL query in a canonical form, so equivalent spellings share a search.
+    
+    Collapses whitespace between tokens and uppercases keywords; quoted values
+    are kept exactly as written. Queries this module can't tokenize are only
+    stripped.
+    """
+    parts = []
+    position = 0
+    jql = jql.strip()
+    
+    while position < len(jql):
+        match = _TOKEN.match(jql, position)
+        if match is None:
+            return jql
+        
+        text = match.group(0).strip()
+        if text.upper() in _KEYWORDS and match.group(4) is not None:
+            parts.append(text.upper())
+        elif parts and parts[-1].endswith(("<", ">")) and text == "=" and match.group(0) == "=":
+            # The tokenizer splits ">=" and "<=" after a field name; keep them whole
+            parts[-1] += text
+        else:
+            parts.append(text)
+        position = match.end()
+    
+    return " ".join(parts)
+
+
+def split_order_by(jql: str) -> Tuple[str, str]:
+    """
+    Split a JQL query into its search clause and its ORDER BY clause.
+    
+    Only an ORDER BY outside quoted values counts. The ORDER BY part is ""
+    when the query has none or can't be tokenized.
+    """
+    order_start = None
+    position = 0
+    
+    while position < len(jql):
+        match = _TOKEN.match(jql, position)
+        if match is None:
+            break
+        
+        # Quoted values never match here, only bare words
+        word = (match.group(4) or "").upper()
+        if word == "BY" and order_start is not None:
+            return jql[:order_start].strip(), jql[order_start:].strip()
+        
+        order_start = match.start(4) if word == "ORDER" else None
+        position = match.end()
+    
+    return jql.strip(), ""
\ No newline at end of file
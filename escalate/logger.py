@@ -1,42 +1,110 @@
 """Logging functionality for the escalate tool."""
 import json
 import logging
-import requests
-from typing import Dict, Any
+import queue
+import threading
+import time
+from typing import Dict, Any, List
 
 from escalate.models import EscalationEvent
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts for Sumo Logic requests, in seconds
+SUMO_TIMEOUT = (3, 10)
+
+# Queued events are uploaded once either limit is reached
+SUMO_BATCH_MAX_EVENTS = 512
+SUMO_BATCH_MAX_BYTES = 1024 * 1024
+
+# How long the upload thread waits for more events before sending a partial batch
+SUMO_BATCH_LINGER_SECONDS = 1.0
+
+# Markers put on the upload queue by flush() and close()
+_FLUSH = object()
+_STOP = object()
+
+def _create_session():
+    """Create a pooled HTTP session that retries transient Sumo Logic failures."""
+    # Imported here so the CLI doesn't pay for requests unless Sumo Logic is used
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False
+    )
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=16, max_retries=retry))
+    return session
+
 class SumoLogicHandler:
     """Handler for sending logs to Sumo Logic."""
     
     def __init__(self, endpoint_url: str):
         """Initialize with the Sumo Logic HTTP Source URL."""
         self.endpoint_url = endpoint_url
+        self.session = None
+        
+        # Events are uploaded in batches by a background thread so escalations
+        # never wait on Sumo Logic
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._worker = None
+        
+        # Without an endpoint nothing is ever sent, so don't create the HTTP
+        # session (or import requests) or start the upload thread
+        if endpoint_url:
+            self.session = _create_session()
+            self._worker = threading.Thread(target=self._drain, name="sumo-logic-upload", daemon=True)
+            self._worker.start()
     
-    def log_escalation(self, event: EscalationEvent) -> bool:
-        """
-        Log an escalation event to Sumo Logic.
+    def close(self) -> None:
+        """Upload any queued events, stop the upload thread and close the HTTP session."""
+        if self._closed:
+            return
         
-        Returns True if logging was successful, False otherwise.
-        """
-        if not self.endpoint_url:
-            logger.warning("Sumo Logic endpoint URL not configured, skipping logging")
-            return False
+        self._closed = True
+        if self._worker is not None:
+            self._queue.put(_STOP)
+            self._worker.join()
+        if self.session is not None:
+            self.session.close()
+    
+    def _log_data(self, event: EscalationEvent) -> Dict[str, Any]:
+        """Build the log record for an escalation event."""
+        # Convert the event to a dictionary for logging
+        log_data = event.to_dict()
+        
+        # Add timestamp
+        log_data["timestamp"] = int(time.time())
         
+        return log_data
+    
+    def _serialize(self, event: EscalationEvent) -> bytes:
+        """Serialize an escalation event to a JSON log line, using orjson when it is installed."""
+        return _json_dumps(self._log_data(event))
+    
+    def _post(self, data: bytes, content_type: str) -> bool:
+        """Send a payload to the Sumo Logic HTTP Source."""
         try:
-            # Convert the event to a dictionary for logging
-            log_data = event.to_dict()
-            
-            # Add timestamp
-            log_data["timestamp"] = int(__import__("time").time())
-            
-            # Send to Sumo Logic
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint_url,
-                data=json.dumps(log_data),
-                headers={"Content-Type": "application/json"}
+                data=data,
+                headers={"Content-Type": content_type},
+                timeout=SUMO_TIMEOUT
             )
             
             if response.status_code < 200 or response.status_code >= 300:
@@ -48,6 +116,105 @@ class SumoLogicHandler:
         except Exception as e:
             logger.error(f"Error sending log to Sumo Logic: {str(e)}")
             return False
+    
+    def log_escalation(self, event: EscalationEvent) -> bool:
+        """
+        Log an escalation event to Sumo Logic immediately.
+        
+        Returns True if logging was successful, False otherwise.
+        """
+        if not self.endpoint_url:
+            logger.warning("Sumo Logic endpoint URL not configured, skipping logging")
+            return False
+        
+        try:
+            log_line = self._serialize(event)
+        except Exception as e:
+            logger.error(f"Error sending log to Sumo Logic: {str(e)}")
+            return False
+        
+        return self._post(log_line, "application/json")
+    
+    def enqueue(self, event: EscalationEvent) -> None:
+        """
+        Queue an escalation event for upload by the background thread.
+        
+        Events are sent in batches of up to SUMO_BATCH_MAX_EVENTS events or
+        SUMO_BATCH_MAX_BYTES bytes; call flush() to wait for them to be sent.
+        """
+        if not self.endpoint_url:
+            logger.warning("Sumo Logic endpoint URL not configured, skipping logging")
+            return
+        
+        if self._closed:
+            logger.warning(f"Sumo Logic handler is closed, dropping log for {event.issue_key}")
+            return
+        
+        try:
+            log_data = self._log_data(event)
+        except Exception as e:
+            logger.error(f"Error serializing log for Sumo Logic: {str(e)}")
+            return
+        
+        self._queue.put_nowait(log_data)
+    
+    def flush(self) -> None:
+        """Wait until every queued event has been uploaded."""
+        if self._closed or self._worker is None:
+            return
+        
+        # Tell the upload thread not to linger on a partial batch
+        self._queue.put(_FLUSH)
+        self._queue.join()
+    
+    def _drain(self) -> None:
+        """Upload queued events in batches until close() is called."""
+        batch: List[bytes] = []
+        batch_bytes = 0
+        
+        # Queue items (events and markers) taken but not yet marked done
+        taken = 0
+        
+        while True:
+            try:
+                # Only wait a bounded time for more events once a batch has started
+                item = self._queue.get(timeout=SUMO_BATCH_LINGER_SECONDS if batch else None)
+            except queue.Empty:
+                item = _FLUSH
+            else:
+                taken += 1
+            
+            if item is not _FLUSH and item is not _STOP:
+                try:
+                    log_line = _json_dumps(item)
+                except Exception as e:
+                    logger.error(f"Error serializing log for Sumo Logic: {str(e)}")
+                else:
+                    batch.append(log_line)
+                    batch_bytes += len(log_line) + 1
+                
+                if len(batch) < SUMO_BATCH_MAX_EVENTS and batch_bytes < SUMO_BATCH_MAX_BYTES:
+                    continue
+            
+            if batch:
+                self._upload(batch)
+                batch = []
+                batch_bytes = 0
+            
+            for _ in range(taken):
+                self._queue.task_done()
+            taken = 0
+            
+            if item is _STOP:
+                return
+    
+    def _upload(self, batch: List[bytes]) -> bool:
+        """Send a batch of log lines as one newline-delimited request."""
+        successful = self._post(b"\n".join(batch) + b"\n", "application/x-ndjson")
+        if not successful:
+            logger.error(f"Failed to upload {len(batch)} escalation events to Sumo Logic")
+        
+        return successful
 
 
 def configure_logging(log_level: str = "INFO") -> None:
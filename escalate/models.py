@@ -1,8 +1,15 @@
 """Models for the escalate tool."""
 from enum import Enum
 from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
+import logging
+import sys
+import time
+
+from escalate.storage import PersistenceBackend, open_backend
+
+logger = logging.getLogger(__name__)
 
 
 class EscalationPathType(Enum):
@@ -13,24 +20,39 @@ class EscalationPathType(Enum):
     EMAIL = "email"
 
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Path types by config value, to skip Enum value lookup when parsing rules
+_PATH_TYPES: Dict[str, EscalationPathType] = {path_type.value: path_type for path_type in EscalationPathType}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EscalationPathConfig:
     """Configuration for an escalation path."""
     type: EscalationPathType
-    recipient: str  # User ID, email, etc.
+    recipient: Optional[str]  # User ID, email, etc.
     message_template: Optional[str] = None
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EscalationPathConfig":
         """Create an EscalationPathConfig from a dictionary."""
+        path_type = _PATH_TYPES.get(data["type"])
+        if path_type is None:
+            raise ValueError(
+                f"Unknown escalation path type {data['type']!r}; "
+                f"expected one of: {', '.join(_PATH_TYPES)}"
+            )
+        
         return cls(
-            type=EscalationPathType(data["type"]),
-            recipient=data["recipient"],
+            type=path_type,
+            recipient=data.get("recipient"),
             message_template=data.get("message_template")
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Rule:
     """A rule for when to escalate an issue."""
     jql: str
@@ -40,6 +62,7 @@ class Rule:
     description: Optional[str] = None
     level: int = 1  # Escalation level (1-based)
     days_to_activate: int = 0  # Number of days after issue matches criteria before this rule activates
+    max_results: Optional[int] = None  # Cap on issues fetched per search (default: all matches)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Rule":
@@ -55,11 +78,12 @@ class Rule:
             name=data.get("name"),
             description=data.get("description"),
             level=data.get("level", 1),
-            days_to_activate=data.get("days_to_activate", 0)
+            days_to_activate=data.get("days_to_activate", 0),
+            max_results=data.get("max_results")
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EscalationEvent:
     """An event representing an escalation."""
     issue_key: str
@@ -70,23 +94,28 @@ class EscalationEvent:
     rule: Rule
     escalation_path: EscalationPathConfig
     level: int = 1
-    timestamp: datetime.datetime = datetime.datetime.now()
+    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
     successful: bool = False
     error_message: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the event to a dictionary for logging."""
+        # A dict literal with constant keys builds in one step; bind the
+        # nested objects once instead of walking each attribute chain
+        rule = self.rule
+        escalation_path = self.escalation_path
+        
         return {
             "issue_key": self.issue_key,
             "issue_summary": self.issue_summary,
             "issue_assignee": self.issue_assignee,
             "status": self.status,
             "time_in_status_minutes": self.time_in_status_minutes,
-            "rule_name": self.rule.name,
-            "rule_jql": self.rule.jql,
-            "max_time_in_status_minutes": self.rule.max_time_in_status_minutes,
-            "escalation_path_type": self.escalation_path.type.value,
-            "escalation_path_recipient": self.escalation_path.recipient,
+            "rule_name": rule.name,
+            "rule_jql": rule.jql,
+            "max_time_in_status_minutes": rule.max_time_in_status_minutes,
+            "escalation_path_type": escalation_path.type.value,
+            "escalation_path_recipient": escalation_path.recipient,
             "level": self.level,
             "timestamp": self.timestamp.isoformat(),
             "successful": self.successful,
@@ -94,15 +123,68 @@ class EscalationEvent:
         }
 
 
+_HOUR_SECS = 3600.0
+_DAY_SECS = 86400.0
+
+
+def _parse_timestamp(value: Any) -> float:
+    """Read a stored timestamp as epoch seconds; older files hold isoformat strings."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+
+class Clock:
+    """The current time in epoch seconds, as escalation history checks see it."""
+    
+    def now(self) -> float:
+        return time.time()
+    
+    def snapshot(self) -> "Clock":
+        """Get a clock stopped at the current time, so a whole run sees the same now."""
+        return _FrozenClock(self.now())
+
+
+class _FrozenClock(Clock):
+    """A clock that always reports the time it was created with."""
+    
+    def __init__(self, now: float):
+        self._now = now
+    
+    def now(self) -> float:
+        return self._now
+
+
 class EscalationHistory:
     """Tracks the history of escalations to prevent duplicates."""
     
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(self, storage_path: Optional[str] = None, clock: Optional[Clock] = None):
         """Initialize the escalation history."""
         self.storage_path = storage_path
+        
+        # Read for every recency check and recorded escalation; the escalator swaps
+        # in a snapshot for each run
+        self.clock = clock or Clock()
+        
+        # JSON, SQLite or binary storage, picked from the file extension
+        self._backend: Optional[PersistenceBackend] = open_backend(storage_path) if storage_path else None
+        
+        # Changes not yet written to storage; flush() persists them in one write.
+        # Each entry is (issue_key, level, timestamp), or (issue_key, None, None)
+        # for a deleted issue.
+        self._pending: List[tuple] = []
+        self._dirty = False
+        
         # Dictionary to track the last time an issue was escalated at each level
-        # Key: (issue_key, level) tuple, Value: timestamp
-        self.last_escalations: Dict[tuple, datetime.datetime] = {}
+        # Key: (issue_key, level) tuple, Value: timestamp in epoch seconds
+        self.last_escalations: Dict[tuple, float] = {}
+        
+        # The same timestamps indexed by issue: issue_key -> {level: timestamp}
+        self._by_issue: Dict[str, Dict[int, float]] = {}
+        
+        # When each issue was first escalated at any level; unlike the per-level
+        # timestamps this isn't moved forward by later escalations
+        self._first_seen: Dict[str, float] = {}
         
         # Load history from storage if available
         if storage_path:
@@ -120,30 +202,64 @@ class EscalationHistory:
         Returns:
             True if the issue was escalated at this level within the time period
         """
-        key = (issue_key, level)
-        if key not in self.last_escalations:
+        # Most issues were never escalated; reject them on the issue key alone,
+        # without building a (issue_key, level) tuple
+        levels = self._by_issue.get(issue_key)
+        if levels is None:
+            return False
+        
+        last_time = levels.get(level)
+        if last_time is None:
             return False
-            
-        last_time = self.last_escalations[key]
-        time_since = datetime.datetime.now() - last_time
         
         # Check if it's been less than the specified hours
-        return time_since < datetime.timedelta(hours=hours)
+        return self.clock.now() - last_time < hours * _HOUR_SECS
     
     def record_escalation(self, issue_key: str, level: int) -> None:
         """
         Record that an issue was escalated at a specific level.
         
+        The change is kept in memory until flush() is called.
+        
         Args:
             issue_key: The JIRA issue key
             level: The escalation level
         """
+        # Interned keys are stored once and compare by identity in later lookups
+        issue_key = sys.intern(issue_key)
         key = (issue_key, level)
-        self.last_escalations[key] = datetime.datetime.now()
+        timestamp = self.clock.now()
+        self.last_escalations[key] = timestamp
+        self._by_issue.setdefault(issue_key, {})[level] = timestamp
+        self._first_seen.setdefault(issue_key, timestamp)
+        
+        self._pending.append((issue_key, level, timestamp))
+        self._dirty = True
+    
+    def delete_issue(self, issue_key: str) -> int:
+        """
+        Remove all recorded escalations for an issue.
+        
+        The change is kept in memory until flush() is called.
+        
+        Args:
+            issue_key: The JIRA issue key
+            
+        Returns:
+            The number of entries removed
+        """
+        to_remove = [key for key in self.last_escalations if key[0] == issue_key]
+        
+        for key in to_remove:
+            del self.last_escalations[key]
+        self._by_issue.pop(issue_key, None)
+        self._first_seen.pop(issue_key, None)
         
-        # Save to storage if configured
-        if self.storage_path:
-            self.save_history()
+        if to_remove:
+            self._pending.append((issue_key, None, None))
+            self._dirty = True
+        
+        return len(to_remove)
     
     def get_issue_first_seen(self, issue_key: str) -> Optional[datetime.datetime]:
         """
@@ -155,17 +271,37 @@ class EscalationHistory:
         Returns:
             The datetime when the issue was first escalated, or None if never escalated
         """
-        # Look for any keys with this issue
-        timestamps = [
-            timestamp for (key, _), timestamp in self.last_escalations.items()
-            if key == issue_key
-        ]
-        
-        if not timestamps:
+        first_seen = self._first_seen.get(issue_key)
+        if first_seen is None:
             return None
+        return datetime.datetime.fromtimestamp(first_seen)
+    
+    def get_entry(self, issue_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get everything recorded for an issue in a single lookup.
+        
+        Args:
+            issue_key: The JIRA issue key
             
-        # Return the earliest timestamp
-        return min(timestamps)
+        Returns:
+            A dict with the issue's first escalation time under "first" and a
+            {level: last escalation time} mapping under "levels", all in epoch
+            seconds, or None if the issue was never escalated
+        """
+        levels = self._by_issue.get(issue_key)
+        if not levels:
+            return None
+        
+        return {"first": self._first_seen[issue_key], "levels": dict(levels)}
+    
+    def get_all_first_seen(self) -> Dict[str, float]:
+        """
+        Get the first-seen timestamp of every issue in the history.
+        
+        Returns:
+            A dict mapping each issue key to when it was first escalated, in epoch seconds
+        """
+        return dict(self._first_seen)
     
     def get_days_since_first_escalation(self, issue_key: str) -> Optional[int]:
         """
@@ -177,53 +313,79 @@ class EscalationHistory:
         Returns:
             The number of days since first escalation, or None if never escalated
         """
-        first_seen = self.get_issue_first_seen(issue_key)
-        if not first_seen:
+        first_seen = self._first_seen.get(issue_key)
+        if first_seen is None:
             return None
             
-        days = (datetime.datetime.now() - first_seen).days
+        days = int((self.clock.now() - first_seen) // _DAY_SECS)
         return days
     
+    def flush(self) -> None:
+        """
+        Write changes made since the last flush to storage in a single update.
+        
+        Call once per escalation run, after recording its escalations. If the
+        write fails the changes stay pending, and the next flush (or close)
+        tries them again.
+        """
+        if not self._dirty:
+            return
+        
+        if self._backend is not None:
+            try:
+                self._backend.apply(self._pending, self.last_escalations, self._first_seen)
+            except Exception as e:
+                logger.error(f"Failed to save escalation history, keeping changes for the next flush: {str(e)}")
+                return
+        
+        self._pending = []
+        self._dirty = False
+    
     def save_history(self) -> None:
-        """Save escalation history to disk."""
+        """Save the whole escalation history to storage."""
         try:
-            import json
-            import os
-            
-            # Convert data to serializable format
-            data = {}
-            for (issue_key, level), timestamp in self.last_escalations.items():
-                key = f"{issue_key}:{level}"
-                data[key] = timestamp.isoformat()
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-            
-            # Write to file
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f)
+            self._backend.save(self.last_escalations, self._first_seen)
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to save escalation history: {str(e)}")
+            logger.error(f"Failed to save escalation history: {str(e)}")
     
     def load_history(self) -> None:
-        """Load escalation history from disk."""
+        """Load escalation history from storage."""
         try:
-            import json
-            import os
+            rows, first_seen = self._backend.load()
             
-            if not os.path.exists(self.storage_path):
-                return
+            # Issue keys are interned so the first-seen map, both indexes and the
+            # keys of later JIRA searches share one string per issue
+            intern = sys.intern
+            for issue_key, stored in first_seen.items():
+                self._first_seen[intern(issue_key)] = _parse_timestamp(stored)
+            
+            # Convert back to internal format; bound locals keep the per-entry work
+            # down for large histories
+            last_escalations = self.last_escalations
+            by_issue = self._by_issue
+            for issue_key, level, stored in rows:
+                issue_key = intern(issue_key)
+                timestamp = stored if type(stored) is float else _parse_timestamp(stored)
+                last_escalations[(issue_key, level)] = timestamp
                 
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
+                levels = by_issue.get(issue_key)
+                if levels is None:
+                    levels = by_issue[issue_key] = {}
+                levels[level] = timestamp
             
-            # Convert back to internal format
-            for key_str, timestamp_str in data.items():
-                issue_key, level_str = key_str.split(':', 1)
-                level = int(level_str)
-                timestamp = datetime.datetime.fromisoformat(timestamp_str)
-                self.last_escalations[(issue_key, level)] = timestamp
+            self._fill_first_seen()
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to load escalation history: {str(e)}")
\ No newline at end of file
+            logger.error(f"Failed to load escalation history: {str(e)}")
+    
+    def _fill_first_seen(self) -> None:
+        """Use an issue's earliest recorded escalation as first seen when none was stored."""
+        for issue_key, levels in self._by_issue.items():
+            if issue_key not in self._first_seen:
+                self._first_seen[issue_key] = min(levels.values())
+    
+    def close(self) -> None:
+        """Write any unflushed changes and release the storage backend."""
+        self.flush()
+        
+        if self._backend is not None:
+            self._backend.close()
\ No newline at end of file
@@ -0,0 +1,310 @@
+"""Storage backends for the escalation history."""
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Protocol, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# History files with these extensions are stored in SQLite or the binary format instead of JSON
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+BINARY_EXTENSIONS = (".bin",)
+
+# Key of the first-seen map in JSON history files; it has no ':' so it can't
+# clash with an "ISSUE-1:level" entry
+_FIRST_SEEN_KEY = "first_seen"
+
+# A stored escalation as (issue_key, level, timestamp). Timestamps are epoch
+# seconds, or isoformat strings in files written by older versions.
+Row = Tuple[str, int, Any]
+
+
+class PersistenceBackend(Protocol):
+    """Where an EscalationHistory keeps its escalations between runs."""
+    
+    def load(self) -> Tuple[Iterable[Row], Dict[str, Any]]:
+        """Read the stored escalations and each issue's first-seen time."""
+    
+    def save(self, escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        """Replace everything stored with the given history."""
+    
+    def apply(self, changes: List[tuple], escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        """
+        Store the changes made since the last write.
+        
+        Each change is (issue_key, level, timestamp), or (issue_key, None, None)
+        for a deleted issue. escalations and first_seen hold the whole history
+        after the changes, for backends that can only rewrite everything.
+        """
+    
+    def close(self) -> None:
+        """Release any open handle on the storage."""
+
+
+def open_backend(storage_path: str) -> PersistenceBackend:
+    """Pick the backend for a history file from its extension."""
+    lowered = storage_path.lower()
+    if lowered.endswith(SQLITE_EXTENSIONS):
+        return SQLiteBackend(storage_path)
+    if lowered.endswith(BINARY_EXTENSIONS):
+        return BinaryBackend(storage_path)
+    return JSONBackend(storage_path)
+
+
+def _ensure_directory(path: str) -> None:
+    """Create the directory a storage file lives in, if it has one."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+class JSONBackend:
+    """Keeps the history as one JSON object, rewritten on every save."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+        
+        # The directory is created on the first save rather than checked on every one
+        self._directory_ready = False
+    
+    def load(self) -> Tuple[Iterable[Row], Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return [], {}
+        
+        with open(self.path, 'rb') as f:
+            data = _json_loads(f.read())
+        
+        # Files written before first-seen times were stored don't have them
+        first_seen = data.pop(_FIRST_SEEN_KEY, {})
+        return _json_rows(data), first_seen
+    
+    def save(self, escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        # Convert data to serializable format
+        data: Dict[str, Any] = {
+            f"{issue_key}:{level}": timestamp
+            for (issue_key, level), timestamp in escalations.items()
+        }
+        data[_FIRST_SEEN_KEY] = first_seen
+        
+        if not self._directory_ready:
+            _ensure_directory(self.path)
+            self._directory_ready = True
+        
+        # Write to a temporary file and swap it in, so readers never see a partial file
+        with open(self._tmp_path, 'wb') as f:
+            f.write(_json_dumps(data))
+        os.replace(self._tmp_path, self.path)
+    
+    def apply(self, changes: List[tuple], escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        # A JSON file can't be updated in place
+        self.save(escalations, first_seen)
+    
+    def close(self) -> None:
+        pass
+
+
+def _json_rows(data: Dict[str, Any]) -> Iterator[Row]:
+    """Split "ISSUE-1:level" keys from a JSON history file into rows."""
+    for key_str, stored in data.items():
+        # Levels follow the last ':'
+        issue_key, _, level_str = key_str.rpartition(':')
+        yield issue_key, int(level_str), stored
+
+
+class SQLiteBackend:
+    """Keeps the history in SQLite, updated one row at a time instead of rewriting the file."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._db = None
+    
+    def _connect(self):
+        """Open the SQLite history database, creating its tables if needed."""
+        if self._db is None:
+            import sqlite3
+            
+            _ensure_directory(self.path)
+            
+            # Autocommit; worker threads record escalations through a shared lock
+            self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS escalations ("
+                "issue_key TEXT NOT NULL, "
+                "level INTEGER NOT NULL, "
+                "timestamp REAL NOT NULL, "
+                "PRIMARY KEY (issue_key, level))"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS first_seen ("
+                "issue_key TEXT PRIMARY KEY, "
+                "timestamp REAL NOT NULL)"
+            )
+        
+        return self._db
+    
+    def load(self) -> Tuple[Iterable[Row], Dict[str, Any]]:
+        # Reading a history that doesn't exist yet shouldn't create the database;
+        # the first write does that
+        if self._db is None and not os.path.exists(self.path):
+            return [], {}
+        
+        db = self._connect()
+        first_seen = dict(db.execute("SELECT issue_key, timestamp FROM first_seen"))
+        return db.execute("SELECT issue_key, level, timestamp FROM escalations"), first_seen
+    
+    def save(self, escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        db = self._connect()
+        rows = [
+            (issue_key, level, timestamp)
+            for (issue_key, level), timestamp in escalations.items()
+        ]
+        
+        with db:
+            db.execute("BEGIN")
+            db.execute("DELETE FROM escalations")
+            db.executemany("INSERT INTO escalations (issue_key, level, timestamp) VALUES (?, ?, ?)", rows)
+            db.execute("DELETE FROM first_seen")
+            db.executemany("INSERT INTO first_seen (issue_key, timestamp) VALUES (?, ?)", list(first_seen.items()))
+    
+    def apply(self, changes: List[tuple], escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        db = self._connect()
+        
+        # Runs of escalations between deletes are written with executemany, in
+        # one transaction for the whole flush
+        with db:
+            db.execute("BEGIN")
+            rows: List[tuple] = []
+            for issue_key, level, timestamp in changes:
+                if level is not None:
+                    rows.append((issue_key, level, timestamp))
+                    continue
+                
+                # Earlier escalations of a deleted issue have to be written first
+                self._insert(db, rows)
+                rows = []
+                db.execute("DELETE FROM escalations WHERE issue_key = ?", (issue_key,))
+                db.execute("DELETE FROM first_seen WHERE issue_key = ?", (issue_key,))
+            
+            self._insert(db, rows)
+    
+    @staticmethod
+    def _insert(db, rows: List[tuple]) -> None:
+        """Write (issue_key, level, timestamp) rows, keeping existing first-seen times."""
+        if not rows:
+            return
+        
+        db.executemany("INSERT OR REPLACE INTO escalations (issue_key, level, timestamp) VALUES (?, ?, ?)", rows)
+        db.executemany(
+            "INSERT OR IGNORE INTO first_seen (issue_key, timestamp) VALUES (?, ?)",
+            [(issue_key, timestamp) for issue_key, _, timestamp in rows]
+        )
+    
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Binary history layout: a header, the issue keys as one newline-separated
+# UTF-8 block, then fixed-size records that refer to keys by index
+_BINARY_MAGIC = b"ESCH"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sHxxIIII")  # magic, version, key count, key bytes, escalations, first-seen
+_BINARY_ESCALATION = struct.Struct("<IHxxd")  # key index, level, timestamp
+_BINARY_FIRST_SEEN = struct.Struct("<Id")  # key index, timestamp
+
+
+class BinaryBackend:
+    """
+    Keeps the history as packed fixed-size records, rewritten on every save.
+    
+    Loading memory-maps the file and unpacks the records in C with
+    struct.iter_unpack, so nothing has to be parsed token by token.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+        self._directory_ready = False
+    
+    def load(self) -> Tuple[Iterable[Row], Dict[str, Any]]:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return [], {}
+        
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, key_count, key_bytes, escalation_count, first_seen_count = _BINARY_HEADER.unpack_from(mm)
+            if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+                raise ValueError(f"{self.path} is not a version {_BINARY_VERSION} escalation history file")
+            
+            offset = _BINARY_HEADER.size
+            keys = mm[offset:offset + key_bytes].decode("utf-8").split("\n") if key_count else []
+            offset += key_bytes
+            
+            escalations_end = offset + escalation_count * _BINARY_ESCALATION.size
+            rows = [
+                (keys[index], level, timestamp)
+                for index, level, timestamp in _BINARY_ESCALATION.iter_unpack(mm[offset:escalations_end])
+            ]
+            
+            first_seen_end = escalations_end + first_seen_count * _BINARY_FIRST_SEEN.size
+            first_seen = {
+                keys[index]: timestamp
+                for index, timestamp in _BINARY_FIRST_SEEN.iter_unpack(mm[escalations_end:first_seen_end])
+            }
+        
+        return rows, first_seen
+    
+    def save(self, escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        # Every issue key is written once and referred to by its index
+        key_index: Dict[str, int] = {}
+        for issue_key in first_seen:
+            key_index.setdefault(issue_key, len(key_index))
+        for issue_key, _ in escalations:
+            key_index.setdefault(issue_key, len(key_index))
+        
+        key_block = "\n".join(key_index).encode("utf-8")
+        parts = [
+            _BINARY_HEADER.pack(
+                _BINARY_MAGIC, _BINARY_VERSION, len(key_index), len(key_block),
+                len(escalations), len(first_seen)
+            ),
+            key_block,
+        ]
+        
+        pack_escalation = _BINARY_ESCALATION.pack
+        parts.extend(
+            pack_escalation(key_index[issue_key], level, timestamp)
+            for (issue_key, level), timestamp in escalations.items()
+        )
+        pack_first_seen = _BINARY_FIRST_SEEN.pack
+        parts.extend(
+            pack_first_seen(key_index[issue_key], timestamp)
+            for issue_key, timestamp in first_seen.items()
+        )
+        
+        if not self._directory_ready:
+            _ensure_directory(self.path)
+            self._directory_ready = True
+        
+        # Write to a temporary file and swap it in, so readers never see a partial file
+        with open(self._tmp_path, 'wb') as f:
+            f.write(b"".join(parts))
+        os.replace(self._tmp_path, self.path)
+    
+    def apply(self, changes: List[tuple], escalations: Dict[Tuple[str, int], float], first_seen: Dict[str, float]) -> None:
+        # Records refer to a key table at the front of the file, so it is rewritten whole
+        self.save(escalations, first_seen)
+    
+    def close(self) -> None:
+        pass
\ No newline at end of file
@@ -11,6 +11,9 @@ setup(
         "jira",
         "python-dotenv",
     ],
+    extras_require={
+        "fast": ["orjson"],  # Faster JSON parsing, used when installed
+    },
     entry_points={
         "console_scripts": [
             "escalate=escalate.cli:main",
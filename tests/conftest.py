@@ -0,0 +1,10 @@
+"""Shared test fixtures."""
+import pytest
+from escalate.config import _load_config_cached
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache():
+    """Keep tests from sharing configs parsed by earlier tests."""
+    _load_config_cached.cache_clear()
+    yield
+    _load_config_cached.cache_clear()
\ No newline at end of file
@@ -1,14 +1,15 @@
 """Tests for the config module."""
+import io
 import os
 import pytest
-import tempfile
 import json
-from escalate.config import Config
+from escalate.config import Config, _load_config_cached, _read_config_file
+from escalate.models import Rule, EscalationPathType
 
 @pytest.fixture
-def config_file():
-    """Create a temporary config file for testing."""
-    config_data = {
+def config_data():
+    """Build config data for testing."""
+    return {
         "rules": [
             {
                 "name": "Test Rule",
@@ -27,14 +28,17 @@ def config_file():
         "jira_username": "test_user",
         "jira_api_token": "test_token"
     }
-    
-    with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-        json.dump(config_data, f)
-        return f.name
 
-def test_load_config(config_file):
-    """Test loading configuration from a file."""
-    config = Config(config_file)
+@pytest.fixture
+def config_file(config_data, tmp_path):
+    """Write the test config data to a file, for tests that need a real path."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(config_data))
+    return str(path)
+
+def test_load_config(config_data):
+    """Test loading configuration from a dict."""
+    config = Config(config_data)
     
     assert config.jira_url == "https://test-jira.example.com"
     assert config.jira_username == "test_user"
@@ -42,17 +46,30 @@ def test_load_config(config_file):
     assert len(config.rules) == 1
     
     rule = config.rules[0]
-    assert rule["name"] == "Test Rule"
-    assert rule["jql"] == "project = TEST"
-    assert rule["max_time_in_status_minutes"] == 60
-    assert rule["description"] == "Test description"
-    assert len(rule["escalation_paths"]) == 1
-    assert rule["escalation_paths"][0]["type"] == "jira_comment"
-    assert rule["escalation_paths"][0]["recipient"] == "username"
+    assert isinstance(rule, Rule)
+    assert rule.name == "Test Rule"
+    assert rule.jql == "project = TEST"
+    assert rule.max_time_in_status_minutes == 60
+    assert rule.description == "Test description"
+    assert len(rule.escalation_paths) == 1
+    assert rule.escalation_paths[0].type == EscalationPathType.JIRA_COMMENT
+    assert rule.escalation_paths[0].recipient == "username"
 
-def test_validate_valid_config(config_file):
+def test_load_config_from_file_and_stream(config_data, config_file):
+    """Test that file paths and file-like objects load the same rules as a dict."""
+    expected = Config(config_data).rules
+    
+    assert Config(io.StringIO(json.dumps(config_data))).rules == expected
+    assert Config(io.BytesIO(json.dumps(config_data).encode())).rules == expected
+    
+    # Only file paths go through the parse cache
+    assert _load_config_cached.cache_info().currsize == 0
+    assert Config(config_file).rules == expected
+    assert _load_config_cached.cache_info().currsize == 1
+
+def test_validate_valid_config(config_data):
     """Test validation with a valid configuration."""
-    config = Config(config_file)
+    config = Config(config_data)
     assert config.validate() is True
 
 def test_validate_missing_jira_credentials():
@@ -71,4 +88,34 @@ def test_validate_missing_rules():
     config.jira_api_token = "test_token"
     config.rules = []
     
-    assert config.validate() is False
\ No newline at end of file
+    assert config.validate() is False
+
+def test_load_config_uses_parse_cache(config_file):
+    """Test that the config parse cache is refreshed when the file changes."""
+    assert Config(config_file).rules[0].name == "Test Rule"
+    assert _read_config_file(config_file) is _read_config_file(config_file)
+    
+    with open(config_file) as f:
+        config_data = json.load(f)
+    config_data["rules"][0]["name"] = "Renamed Rule"
+    with open(config_file, 'w') as f:
+        json.dump(config_data, f)
+    
+    assert Config(config_file).rules[0].name == "Renamed Rule"
+
+def test_rules_by_level_refreshed_on_reload(config_file):
+    """Test that cached derived values are dropped when the config is reloaded."""
+    config = Config(config_file)
+    assert list(config.rules_by_level) == [1]
+    assert config.history_file_path != "/tmp/other_history.json"
+    
+    with open(config_file) as f:
+        config_data = json.load(f)
+    config_data["rules"][0]["level"] = 2
+    config_data["history_file"] = "/tmp/other_history.json"
+    with open(config_file, 'w') as f:
+        json.dump(config_data, f)
+    
+    config.load_config(config_file)
+    assert list(config.rules_by_level) == [2]
+    assert config.history_file_path == "/tmp/other_history.json"
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Tests for the email escalation path."""
+import smtplib
+from escalate.escalation_paths.email import EmailEscalationPath
+from escalate.models import Rule, EscalationPathConfig, EscalationPathType, EscalationEvent
+
+class FakeSMTP:
+    """SMTP connection that can be made to drop the next message."""
+    
+    def __init__(self, sent, drop_next=False):
+        self.sent = sent
+        self.drop_next = drop_next
+    
+    def send_message(self, email):
+        if self.drop_next:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(email["To"])
+    
+    def quit(self):
+        pass
+
+def make_event(recipient):
+    """An email escalation event for TEST-1."""
+    path_config = EscalationPathConfig(type=EscalationPathType.EMAIL, recipient=recipient)
+    rule = Rule(jql="project = TEST", max_time_in_status_minutes=60, escalation_paths=[path_config])
+    return EscalationEvent(
+        issue_key="TEST-1",
+        issue_summary="Test issue",
+        issue_assignee=None,
+        status="Open",
+        time_in_status_minutes=90.0,
+        rule=rule,
+        escalation_path=path_config
+    )
+
+def test_session_reconnects_after_server_drops_connection(monkeypatch):
+    """Test that an email on a connection the server closed is retried on a new one."""
+    sent = []
+    connections = []
+    
+    def connect(self):
+        connections.append(FakeSMTP(sent))
+        return connections[-1]
+    
+    monkeypatch.setattr(EmailEscalationPath, "_connect", connect)
+    path = EmailEscalationPath(sender="bot@example.com", password="secret")
+    
+    with path:
+        assert path.escalate(make_event("first@example.com"))
+        connections[0].drop_next = True
+        assert path.escalate(make_event("second@example.com"))
+    
+    assert sent == ["first@example.com", "second@example.com"]
+    assert len(connections) == 2
+
+def test_session_reports_failure_after_one_retry(monkeypatch):
+    """Test that a send that also fails on a fresh connection is reported as failed."""
+    monkeypatch.setattr(EmailEscalationPath, "_connect", lambda self: FakeSMTP([], drop_next=True))
+    path = EmailEscalationPath(sender="bot@example.com", password="secret")
+    
+    with path:
+        path._server = FakeSMTP([], drop_next=True)
+        event = make_event("first@example.com")
+        assert path.escalate(event) is False
+        assert "Connection unexpectedly closed" in event.error_message
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Tests for the escalator module."""
+from unittest.mock import MagicMock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+import escalate.jira_client
+from escalate.config import Config
+from escalate.escalator import Escalator
+from escalate.escalation_paths import EscalationPath, SlackDMEscalationPath
+from escalate.models import EscalationPathType
+
+class FakeJIRA:
+    """Stands in for the jira library's client; no request reaches a server."""
+    
+    def __init__(self, *args, **kwargs):
+        pass
+
+class FakePath(EscalationPath):
+    """Escalation path that records events and fails for recipients in `failing`."""
+    
+    def __init__(self):
+        self.sent = []
+        self.failing = set()
+    
+    def escalate(self, event):
+        self.sent.append((event.issue_key, event.escalation_path.recipient, event.level))
+        return event.escalation_path.recipient not in self.failing
+
+def make_issue(key):
+    """An issue dict as produced by JiraClient."""
+    return {
+        "key": key,
+        "summary": f"Summary of {key}",
+        "assignee": None,
+        "status": "Open",
+        "time_in_status_minutes": 120.0
+    }
+
+@pytest.fixture
+def escalator(tmp_path, monkeypatch):
+    """An Escalator with a fake JIRA client and a fake Slack DM path."""
+    monkeypatch.setenv("JIRA_URL", "https://test-jira.example.com")
+    monkeypatch.setattr(escalate.jira_client, "JIRA", FakeJIRA)
+    
+    config = Config({
+        "jira_url": "https://test-jira.example.com",
+        "jira_username": "test_user",
+        "jira_api_token": "test_token",
+        "history_file": str(tmp_path / "history.json"),
+        "rules": [
+            {
+                "jql": "project = TEST",
+                "max_time_in_status_minutes": 60,
+                "escalation_paths": [{"type": "slack_dm", "recipient": "U1"}]
+            }
+        ]
+    })
+    
+    escalator = Escalator(config)
+    escalator._active_paths = {EscalationPathType.SLACK_DM: FakePath()}
+    yield escalator
+    escalator.close()
+
+def test_process_rules_restores_clock_after_failure(escalator, monkeypatch):
+    """Test that a failed run doesn't leave the history on the run's frozen clock."""
+    live_clock = escalator.history.clock
+    
+    def failing_search(*args, **kwargs):
+        raise RuntimeError("JIRA is down")
+    
+    monkeypatch.setattr(escalator.jira_client, "search", failing_search)
+    
+    with pytest.raises(RuntimeError):
+        escalator.process_rules()
+    
+    assert escalator.history.clock is live_clock
+
+def test_escalate_issue_skips_duplicate_notification(escalator):
+    """Test that a notification already sent this run is skipped but counts as delivered."""
+    path = escalator._active_paths[EscalationPathType.SLACK_DM]
+    rule = escalator.config.rules[0]
+    
+    assert escalator.escalate_issue(make_issue("TEST-1"), rule) is True
+    assert escalator.escalate_issue(make_issue("TEST-1"), rule) is True
+    assert path.sent == [("TEST-1", "U1", 1)]
+
+def test_escalate_issue_retries_after_failure(escalator):
+    """Test that a failed notification can be sent again later in the same run."""
+    path = escalator._active_paths[EscalationPathType.SLACK_DM]
+    path.failing.add("U1")
+    rule = escalator.config.rules[0]
+    
+    assert escalator.escalate_issue(make_issue("TEST-1"), rule) is False
+    
+    path.failing.clear()
+    assert escalator.escalate_issue(make_issue("TEST-1"), rule) is True
+    assert path.sent == [("TEST-1", "U1", 1), ("TEST-1", "U1", 1)]
+
+def test_process_rules_skips_history_for_failed_batched_dm(escalator, monkeypatch):
+    """Test that a combined Slack DM that fails to send isn't recorded as an escalation."""
+    slack_path = SlackDMEscalationPath("xoxb-test")
+    slack_path.client = MagicMock()
+    slack_path.client.conversations_open.return_value = {"channel": {"id": "D1"}}
+    slack_path.client.chat_postMessage.side_effect = SlackApiError("channel_not_found", {"ok": False})
+    escalator._active_paths = {EscalationPathType.SLACK_DM: slack_path}
+    
+    events = []
+    send_issue = escalator._send_issue
+    
+    def recording_send_issue(issue, rule):
+        already_sent, issue_events = send_issue(issue, rule)
+        events.extend(issue_events)
+        return already_sent, issue_events
+    
+    monkeypatch.setattr(escalator, "_send_issue", recording_send_issue)
+    monkeypatch.setattr(escalator.jira_client, "search", lambda *args, **kwargs: [make_issue("TEST-1")])
+    
+    assert escalator.process_rules() == 0
+    assert escalator.history.get_entry("TEST-1") is None
+    assert [event.successful for event in events] == [False]
+    assert not escalator._sent
+def test_process_rules_survives_network_error_in_batched_dm(escalator, monkeypatch):
+    """Test that a transport error sending a combined DM fails its events instead of the run."""
+    slack_path = SlackDMEscalationPath("xoxb-test")
+    slack_path.client = MagicMock()
+    slack_path.client.conversations_open.return_value = {"channel": {"id": "D1"}}
+    slack_path.client.chat_postMessage.side_effect = ConnectionError("connection reset")
+    escalator._active_paths = {EscalationPathType.SLACK_DM: slack_path}
+    monkeypatch.setattr(escalator.jira_client, "search", lambda *args, **kwargs: [make_issue("TEST-1")])
+    
+    assert escalator.process_rules() == 0
+    assert escalator.history.get_entry("TEST-1") is None
+    assert not escalator._sent
+def test_process_rules_survives_network_error_prewarming_slack(escalator, monkeypatch):
+    """Test that a failed DM channel pre-open is retried when the DM is sent."""
+    slack_path = SlackDMEscalationPath("xoxb-test")
+    slack_path.client = MagicMock()
+    slack_path.client.conversations_open.side_effect = [
+        TimeoutError("timed out"),
+        {"channel": {"id": "D1"}}
+    ]
+    escalator._active_paths = {EscalationPathType.SLACK_DM: slack_path}
+    monkeypatch.setattr(escalator.jira_client, "search", lambda *args, **kwargs: [make_issue("TEST-1")])
+    
+    assert escalator.process_rules() == 1
+    assert slack_path.client.conversations_open.call_count == 2
+    slack_path.client.chat_postMessage.assert_called_once()
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Tests for the jira_client module."""
+from types import SimpleNamespace
+import pytest
+from jira.client import ResultList
+from jira.exceptions import JIRAError
+import escalate.jira_client
+from escalate.jira_client import JiraClient, _add_time_in_status_filter
+
+@pytest.mark.parametrize("jql, expected", [
+    ("project = TEST", '(project = TEST) AND NOT status CHANGED AFTER "-30m"'),
+    (
+        "project = TEST OR assignee IS EMPTY",
+        '(project = TEST OR assignee IS EMPTY) AND NOT status CHANGED AFTER "-30m"'
+    ),
+    (
+        "project = TEST ORDER BY created DESC",
+        '(project = TEST) AND NOT status CHANGED AFTER "-30m" ORDER BY created DESC'
+    ),
+    (
+        "project = TEST order by created",
+        '(project = TEST) AND NOT status CHANGED AFTER "-30m" order by created'
+    ),
+    ("", 'NOT status CHANGED AFTER "-30m"'),
+    ("ORDER BY created", 'NOT status CHANGED AFTER "-30m" ORDER BY created'),
+    (
+        'summary ~ "sort order by date" AND project = X',
+        '(summary ~ "sort order by date" AND project = X) AND NOT status CHANGED AFTER "-30m"'
+    ),
+    (
+        "summary ~ 'order by' ORDER BY created",
+        '(summary ~ \'order by\') AND NOT status CHANGED AFTER "-30m" ORDER BY created'
+    ),
+])
+def test_add_time_in_status_filter(jql, expected):
+    """Test that the time-in-status filter is ANDed in before any ORDER BY."""
+    assert _add_time_in_status_filter(jql, 30) == expected
+
+class CappedJIRA:
+    """Fake Jira Server that returns at most `cap` issues per page, with the total."""
+    
+    deploymentType = "Server"
+    
+    def __init__(self, issues, cap):
+        self.issues = issues
+        self.cap = cap
+        self.requests = []
+    
+    def search_issues(self, jql, startAt, maxResults, **kwargs):
+        self.requests.append((startAt, maxResults))
+        page = self.issues[startAt:startAt + min(maxResults, self.cap)]
+        return ResultList(page, _startAt=startAt, _maxResults=maxResults, _total=len(self.issues))
+
+class CappedCloudJIRA(CappedJIRA):
+    """
+    Fake Jira Cloud, paging like the jira library does there.
+    
+    search_issues only serves the first page and rejects startAt; enhanced
+    search pages by token and reports no total, so ResultList.total is just
+    the page length.
+    """
+    
+    deploymentType = "Cloud"
+    
+    def search_issues(self, jql, startAt=0, maxResults=50, **kwargs):
+        if startAt:
+            raise JIRAError("The `search` API is deprecated in Jira Cloud. Use `enhanced_search_issues` method instead.")
+        return self.enhanced_search_issues(jql, maxResults=maxResults)
+    
+    def enhanced_search_issues(self, jql, nextPageToken=None, maxResults=50, **kwargs):
+        start_at = int(nextPageToken) if nextPageToken else 0
+        self.requests.append((start_at, maxResults))
+        end = start_at + min(maxResults, self.cap)
+        next_page_token = str(end) if end < len(self.issues) else None
+        return ResultList(self.issues[start_at:end], _nextPageToken=next_page_token)
+
+def make_jira_issue(number):
+    """A JIRA issue resource, as far as JiraClient reads it."""
+    return SimpleNamespace(
+        key=f"TEST-{number}",
+        fields=SimpleNamespace(
+            summary=f"Issue {number}",
+            status=SimpleNamespace(name="Open"),
+            assignee=None,
+            created="2020-01-01T00:00:00.000+0000"
+        ),
+        changelog=SimpleNamespace(histories=[])
+    )
+
+@pytest.fixture(params=[CappedJIRA, CappedCloudJIRA], ids=["server", "cloud"])
+def make_client(request, monkeypatch):
+    """Build a JiraClient over a capped fake Jira Server or Cloud holding the given issues."""
+    def make(issues, cap):
+        fake = request.param(issues, cap)
+        monkeypatch.setattr(escalate.jira_client, "JIRA", lambda **kwargs: fake)
+        return JiraClient("https://test-jira.example.com", "test_user", "test_token")
+    return make
+
+def test_iter_issues_pages_past_capped_pages(make_client):
+    """Test that pages shorter than requested don't end the search before the total."""
+    client = make_client([make_jira_issue(n) for n in range(250)], cap=50)
+    
+    keys = [issue["key"] for issue in client.iter_issues("project = TEST")]
+    
+    assert keys == [f"TEST-{n}" for n in range(250)]
+    assert [start for start, _ in client.jira.requests] == [0, 50, 100, 150, 200]
+
+def test_iter_issues_honours_max_results(make_client):
+    """Test that max_results caps the issues fetched across capped pages."""
+    client = make_client([make_jira_issue(n) for n in range(250)], cap=50)
+    
+    assert len(list(client.iter_issues("project = TEST", max_results=120))) == 120
+    assert client.jira.requests[-1] == (100, 20)
+
+def test_search_keeps_only_issues_over_threshold(make_client):
+    """Test that search drops issues that can't pass the time-in-status threshold."""
+    client = make_client([make_jira_issue(n) for n in range(3)], cap=50)
+    
+    assert len(client.search("project = TEST")) == 3
+    assert client.search("project = TEST", min_time_in_status_minutes=10 ** 9) == []
\ No newline at end of file
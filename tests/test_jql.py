@@ -0,0 +1,23 @@
+"""Tests for the jql module."""
+import pytest
+from escalate.jql import normalize_jql, split_order_by
+
+@pytest.mark.parametrize("jql, expected", [
+    ("project=TEST and status != Done", "project = TEST AND status != Done"),
+    ("  project = TEST\n  AND status != Done  ", "project = TEST AND status != Done"),
+    ("summary ~ 'two  spaces' order by created desc", "summary ~ 'two  spaces' ORDER BY created DESC"),
+    ("created >= -1d", "created >= -1d"),
+])
+def test_normalize_jql(jql, expected):
+    """Test that equivalent spellings of a query normalize to the same string."""
+    assert normalize_jql(jql) == expected
+
+@pytest.mark.parametrize("jql, expected", [
+    ("project = TEST", ("project = TEST", "")),
+    ("project = TEST order  by created DESC", ("project = TEST", "order  by created DESC")),
+    ('summary ~ "order by" AND project = X', ('summary ~ "order by" AND project = X', "")),
+    ('summary ~ "unterminated order by', ('summary ~ "unterminated order by', "")),
+])
+def test_split_order_by(jql, expected):
+    """Test that only an ORDER BY outside quoted values splits the query."""
+    assert split_order_by(jql) == expected
\ No newline at end of file
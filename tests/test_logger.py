@@ -0,0 +1,10 @@
+"""Tests for the logger module."""
+from escalate.logger import SumoLogicHandler
+
+def test_sumo_handler_without_endpoint_sets_nothing_up():
+    """Test that a handler without an endpoint creates no HTTP session or upload thread."""
+    handler = SumoLogicHandler("")
+    
+    assert handler.session is None
+    assert handler._worker is None
+    handler.close()
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Tests for the models module."""
+import os
+import datetime
 import pytest
-from escalate.models import Rule, EscalationPathConfig, EscalationPathType, EscalationEvent
+from escalate.models import Rule, EscalationPathConfig, EscalationPathType, EscalationEvent, EscalationHistory, Clock
 
 def test_escalation_path_config_from_dict():
     """Test creating an EscalationPathConfig from a dictionary."""
@@ -16,6 +18,18 @@ def test_escalation_path_config_from_dict():
     assert path.recipient == "U12345678"
     assert path.message_template == "Test message"
 
+def test_escalation_path_config_unknown_type():
+    """Test that an unknown escalation path type is rejected with the valid types."""
+    with pytest.raises(ValueError, match="slack_dm"):
+        EscalationPathConfig.from_dict({"type": "carrier_pigeon", "recipient": "U12345678"})
+
+def test_escalation_path_config_without_recipient():
+    """Test that a path without a recipient still loads, as listing rules shows it unset."""
+    path = EscalationPathConfig.from_dict({"type": "pagerduty"})
+    
+    assert path.type == EscalationPathType.PAGERDUTY
+    assert path.recipient is None
+
 def test_rule_from_dict():
     """Test creating a Rule from a dictionary."""
     data = {
@@ -91,4 +105,150 @@ def test_escalation_event_to_dict():
     assert event_dict["escalation_path_type"] == "slack_dm"
     assert event_dict["escalation_path_recipient"] == "U12345678"
     assert event_dict["successful"] is True
-    assert event_dict["error_message"] is None
\ No newline at end of file
+    assert event_dict["error_message"] is None
+
+def test_escalation_history_delete_issue():
+    """Test removing every level recorded for one issue."""
+    history = EscalationHistory()
+    history.record_escalation("TEST-1", 1)
+    history.record_escalation("TEST-1", 2)
+    history.record_escalation("TEST-2", 1)
+    
+    assert history.delete_issue("TEST-1") == 2
+    assert list(history.last_escalations) == [("TEST-2", 1)]
+    assert history.get_issue_first_seen("TEST-1") is None
+    assert history.delete_issue("TEST-1") == 0
+
+def test_escalation_history_get_all_first_seen():
+    """Test that the bulk first-seen lookup matches the per-issue lookup."""
+    history = EscalationHistory()
+    history.record_escalation("TEST-1", 1)
+    history.record_escalation("TEST-2", 1)
+    history.record_escalation("TEST-1", 2)
+    
+    first_seen = history.get_all_first_seen()
+    
+    assert set(first_seen) == {"TEST-1", "TEST-2"}
+    assert datetime.datetime.fromtimestamp(first_seen["TEST-1"]) == history.get_issue_first_seen("TEST-1")
+    assert datetime.datetime.fromtimestamp(first_seen["TEST-2"]) == history.get_issue_first_seen("TEST-2")
+
+def test_rule_from_dict_max_results():
+    """Test that max_results is optional when creating a Rule."""
+    data = {
+        "jql": "project = TEST",
+        "max_time_in_status_minutes": 60,
+        "escalation_paths": []
+    }
+    
+    assert Rule.from_dict(data).max_results is None
+    
+    data["max_results"] = 200
+    assert Rule.from_dict(data).max_results == 200
+
+def test_escalation_history_get_entry():
+    """Test fetching all of an issue's escalations at once."""
+    history = EscalationHistory()
+    history.record_escalation("TEST-1", 1)
+    history.record_escalation("TEST-1", 2)
+    
+    entry = history.get_entry("TEST-1")
+    
+    assert set(entry["levels"]) == {1, 2}
+    assert entry["first"] == min(entry["levels"].values())
+    assert history.get_entry("TEST-2") is None
+    
+    history.delete_issue("TEST-1")
+    assert history.get_entry("TEST-1") is None
+
+def test_escalation_history_sqlite_storage(tmp_path):
+    """Test that history files with a .db extension round-trip through SQLite."""
+    storage_path = str(tmp_path / "history.db")
+    
+    history = EscalationHistory(storage_path)
+    history.record_escalation("TEST-1", 1)
+    history.record_escalation("TEST-1", 2)
+    history.record_escalation("TEST-2", 1)
+    history.delete_issue("TEST-2")
+    history.close()
+    
+    reloaded = EscalationHistory(storage_path)
+    
+    assert reloaded.last_escalations == history.last_escalations
+    assert reloaded.was_recently_escalated("TEST-1", 2)
+    assert not reloaded.was_recently_escalated("TEST-2", 1)
+    reloaded.close()
+
+def test_escalation_history_flush(tmp_path):
+    """Test that recorded escalations are written to storage on flush."""
+    storage_path = str(tmp_path / "history.json")
+    
+    history = EscalationHistory(storage_path)
+    history.record_escalation("TEST-1", 1)
+    history.record_escalation("TEST-2", 1)
+    
+    assert not os.path.exists(storage_path)
+    
+    history.flush()
+    
+    assert EscalationHistory(storage_path).last_escalations == history.last_escalations
+    
+    history.delete_issue("TEST-2")
+    history.flush()
+    
+    assert list(EscalationHistory(storage_path).last_escalations) == [("TEST-1", 1)]
+
+def test_escalation_history_flush_failure_keeps_changes(tmp_path, monkeypatch):
+    """Test that changes survive a failed flush and are written by the next one."""
+    storage_path = str(tmp_path / "history.db")
+    
+    history = EscalationHistory(storage_path)
+    history.record_escalation("TEST-1", 1)
+    
+    def locked(*args):
+        raise RuntimeError("database is locked")
+    
+    monkeypatch.setattr(history._backend, "apply", locked)
+    history.flush()
+    monkeypatch.undo()
+    history.close()
+    
+    assert list(EscalationHistory(storage_path).last_escalations) == [("TEST-1", 1)]
+
+def test_escalation_history_first_seen_persisted(tmp_path):
+    """Test that the first-seen time survives re-escalation and reloading."""
+    storage_path = str(tmp_path / "history.json")
+    
+    history = EscalationHistory(storage_path)
+    history.record_escalation("TEST-1", 1)
+    first_seen = history.get_all_first_seen()["TEST-1"]
+    
+    # Escalating the same level again moves its timestamp but not first seen
+    history.record_escalation("TEST-1", 1)
+    history.flush()
+    
+    assert history.last_escalations[("TEST-1", 1)] >= first_seen
+    assert history.get_all_first_seen()["TEST-1"] == first_seen
+    assert EscalationHistory(storage_path).get_all_first_seen()["TEST-1"] == first_seen
+
+def test_escalation_history_clock():
+    """Test that history checks read the injected clock, and snapshots stay fixed."""
+    class FakeClock(Clock):
+        def __init__(self):
+            self.time = 1_000_000.0
+        
+        def now(self):
+            return self.time
+    
+    clock = FakeClock()
+    history = EscalationHistory(clock=clock)
+    history.record_escalation("TEST-1", 1)
+    assert history.last_escalations[("TEST-1", 1)] == 1_000_000.0
+    
+    snapshot = clock.snapshot()
+    clock.time += 25 * 3600
+    assert not history.was_recently_escalated("TEST-1", 1)
+    assert history.get_days_since_first_escalation("TEST-1") == 1
+    
+    history.clock = snapshot
+    assert history.was_recently_escalated("TEST-1", 1)
+    assert snapshot.now() == 1_000_000.0
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""Tests for the PagerDuty escalation path."""
+from unittest.mock import MagicMock
+import pytest
+from escalate.escalation_paths.pagerduty import PagerDutyEscalationPath
+
+@pytest.fixture
+def path():
+    """A PagerDuty path whose REST API session is a mock."""
+    path = PagerDutyEscalationPath("test_key", "PSERVICE")
+    path.api_session = MagicMock()
+    return path
+
+def test_user_id_lookup_is_cached(path):
+    """Test that a user that was found isn't looked up again."""
+    path.api_session.rget.return_value = [{"id": "PUSER"}]
+    
+    assert path._user_id_for("user@example.com") == "PUSER"
+    assert path._user_id_for("user@example.com") == "PUSER"
+    assert path.api_session.rget.call_count == 1
+
+def test_user_id_lookup_retries_misses_and_errors(path):
+    """Test that a missing user or a failed lookup is looked up again next time."""
+    path.api_session.rget.side_effect = [[], ConnectionError("timed out"), [{"id": "PUSER"}]]
+    
+    assert path._user_id_for("user@example.com") is None
+    with pytest.raises(ConnectionError):
+        path._user_id_for("user@example.com")
+    assert path._user_id_for("user@example.com") == "PUSER"
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""Tests for the storage module."""
+import pytest
+from escalate.storage import BinaryBackend, JSONBackend, SQLiteBackend, open_backend
+
+@pytest.mark.parametrize("file_name, backend_class", [
+    ("history.json", JSONBackend),
+    ("history.db", SQLiteBackend),
+    ("HISTORY.SQLite3", SQLiteBackend),
+    ("history.bin", BinaryBackend),
+])
+def test_open_backend(tmp_path, file_name, backend_class):
+    """Test that the backend is picked from the file extension."""
+    assert isinstance(open_backend(str(tmp_path / file_name)), backend_class)
+
+@pytest.mark.parametrize("file_name", ["history.json", "history.db", "history.bin"])
+def test_backend_apply(tmp_path, file_name):
+    """Test that applied changes, including deletes between escalations, read back."""
+    backend = open_backend(str(tmp_path / "nested" / file_name))
+    backend.save({("TEST-1", 1): 100.0}, {"TEST-1": 100.0})
+    
+    changes = [("TEST-2", 1, 200.0), ("TEST-1", None, None), ("TEST-1", 2, 300.0)]
+    escalations = {("TEST-2", 1): 200.0, ("TEST-1", 2): 300.0}
+    first_seen = {"TEST-2": 200.0, "TEST-1": 300.0}
+    backend.apply(changes, escalations, first_seen)
+    backend.close()
+    
+    rows, stored_first_seen = open_backend(str(tmp_path / "nested" / file_name)).load()
+    assert sorted(rows) == [("TEST-1", 2, 300.0), ("TEST-2", 1, 200.0)]
+    assert stored_first_seen == first_seen
+
+@pytest.mark.parametrize("file_name", ["history.json", "history.db", "history.bin"])
+def test_backend_missing_file(tmp_path, file_name):
+    """Test that a history file that doesn't exist yet loads as empty without being created."""
+    path = tmp_path / "nested" / file_name
+    backend = open_backend(str(path))
+    
+    rows, first_seen = backend.load()
+    backend.close()
+    
+    assert list(rows) == []
+    assert first_seen == {}
+    assert not path.parent.exists()
+
+def test_binary_backend_rejects_other_files(tmp_path):
+    """Test that a .bin file in another format fails to load instead of misreading it."""
+    path = tmp_path / "history.bin"
+    path.write_bytes(b"not an escalation history file")
+    
+    with pytest.raises(ValueError):
+        BinaryBackend(str(path)).load()
\ No newline at end of file